@@ -0,0 +1,114 @@
+# Audio Cache for Supriya Assistant
+# Keeps synthesized speech on disk so repeated phrases play instantly and offline
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+def audio_key(text: str, voice: str, pitch: str, rate: str) -> str:
+    """Content address for one synthesized phrase"""
+    payload = json.dumps([text.strip(), voice, pitch, rate], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class AudioCache:
+    def __init__(self, cache_dir: str = "Data/TTSCache", max_bytes: int = 50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.entries = self._load_index()
+        self.total_bytes = sum(self.entries.values())
+
+    def get(self, text: str, voice: str, pitch: str, rate: str) -> Optional[bytes]:
+        """Get cached MP3 bytes for a phrase, marking it recently used"""
+        key = audio_key(text, voice, pitch, rate)
+        with self._lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+            try:
+                with open(self._path(key), 'rb') as f:
+                    audio = f.read()
+                # The file's mtime carries the LRU order across restarts
+                os.utime(self._path(key))
+            except OSError:
+                self._forget(key)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return audio
+
+    def put(self, text: str, voice: str, pitch: str, rate: str, audio: bytes) -> bool:
+        """Store MP3 bytes for a phrase, evicting least recently used audio past max_bytes"""
+        if not audio or len(audio) > self.max_bytes:
+            return False
+
+        key = audio_key(text, voice, pitch, rate)
+        with self._lock:
+            temp_file = f"{self._path(key)}.tmp"
+            try:
+                with open(temp_file, 'wb') as f:
+                    f.write(audio)
+                os.replace(temp_file, self._path(key))
+            except OSError as e:
+                print(f"❌ Error caching audio: {e}")
+                return False
+
+            self._forget(key)
+            self.entries[key] = len(audio)
+            self.total_bytes += len(audio)
+            while self.total_bytes > self.max_bytes:
+                oldest = next(iter(self.entries))
+                self._forget(oldest)
+                try:
+                    os.remove(self._path(oldest))
+                except OSError:
+                    pass
+        return True
+
+    def clear(self):
+        """Remove all cached audio"""
+        with self._lock:
+            for key in list(self.entries):
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache size and hit/miss counters"""
+        with self._lock:
+            return {"entries": len(self.entries), "bytes": self.total_bytes,
+                    "hits": self.hits, "misses": self.misses}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+
+    def _forget(self, key: str):
+        size = self.entries.pop(key, None)
+        if size is not None:
+            self.total_bytes -= size
+
+    def _load_index(self) -> OrderedDict:
+        """Index cached files from least to most recently used"""
+        files = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.endswith(".tmp"):
+                os.remove(path)
+            elif name.endswith(".mp3"):
+                stat = os.stat(path)
+                files.append((stat.st_mtime, name[:-4], stat.st_size))
+        return OrderedDict((key, size) for _, key, size in sorted(files))
+
+# Global audio cache instance
+audio_cache = AudioCache()
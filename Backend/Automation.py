@@ -18,6 +18,7 @@ import cv2
 from PIL import ImageGrab
 from screen_brightness_control import set_brightness
 from Backend.security import SecuritySystem  
+from Backend.Resilience import call_with_retry
 from Backend.TaskManager import task_manager, create_task_voice, list_tasks_voice, complete_task_voice
 from Backend.EmailManager import email_manager, read_emails_voice, send_email_voice, email_summary_voice
 from Backend.FileManager import file_manager, list_files_voice, search_files_voice, organize_files_voice
@@ -63,7 +64,9 @@ def content(Topic):
     def ContentWriterAI(prompt):
         messages = [{"role": "user", "content": f"{prompt}"}]
         
-        completion = client.chat.completions.create(
+        completion = call_with_retry(
+            "groq",
+            client.chat.completions.create,
             model="mixtral-8x7b-32768", 
             messages=SystemChatBot + messages,
             max_tokens=2048,
@@ -0,0 +1,92 @@
+# Chat Log Store for Supriya Assistant
+# Append-only JSON Lines chat history with a shared in-memory view
+
+import json
+import os
+import threading
+from typing import Dict, List
+
+class ChatLogStore:
+    def __init__(self, log_file: str = "Data/ChatLog.jsonl", legacy_file: str = os.path.join("Data", "ChatLog.json")):
+        self.log_file = log_file
+        self.legacy_file = legacy_file
+        self._lock = threading.RLock()
+
+        os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+        self.messages = self._load_messages()
+
+    def append(self, role: str, content: str) -> int:
+        """Append one message to the log and return its index"""
+        return self._append_messages([{"role": role, "content": content}])
+
+    def append_turn(self, query: str, answer: str):
+        """Append a user query and the assistant's answer as one uninterrupted pair"""
+        self._append_messages([
+            {"role": "user", "content": query},
+            {"role": "assistant", "content": answer}
+        ])
+
+    def all(self) -> List[Dict]:
+        """Get a copy of every message"""
+        with self._lock:
+            return [dict(message) for message in self.messages]
+
+    def tail(self, count: int) -> List[Dict]:
+        """Get a copy of the last count messages"""
+        if count <= 0:
+            return []
+        with self._lock:
+            return [dict(message) for message in self.messages[-count:]]
+
+    def slice(self, start: int, end: int) -> List[Dict]:
+        """Get a copy of messages[start:end]"""
+        with self._lock:
+            return [dict(message) for message in self.messages[start:end]]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self.messages)
+
+    def _append_messages(self, messages: List[Dict]) -> int:
+        """Write messages in one locked append; returns the last index"""
+        with self._lock:
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.write("".join(json.dumps(m, ensure_ascii=False) + "\n" for m in messages))
+            self.messages.extend(messages)
+            return len(self.messages) - 1
+
+    def _load_messages(self) -> List[Dict]:
+        """Load the log once, migrating the old ChatLog.json on first run"""
+        if not os.path.exists(self.log_file):
+            return self._migrate_legacy_log()
+
+        messages = []
+        with open(self.log_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    messages.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A line cut short by a crash only loses that message
+                    print(f"⚠️ Skipping malformed chat log line in {self.log_file}")
+        return messages
+
+    def _migrate_legacy_log(self) -> List[Dict]:
+        """Convert the legacy JSON array log into JSON Lines"""
+        messages = []
+        if os.path.exists(self.legacy_file):
+            try:
+                with open(self.legacy_file, 'r', encoding='utf-8') as f:
+                    messages = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"❌ Error reading legacy chat log: {e}")
+
+        with open(self.log_file, 'w', encoding='utf-8') as f:
+            for message in messages:
+                f.write(json.dumps(message, ensure_ascii=False) + "\n")
+        return messages
+
+# Global chat log store instance
+chat_log_store = ChatLogStore()
@@ -4,10 +4,12 @@ import os
 import datetime
 from dotenv import dotenv_values
 import json
-import geocoder
-import requests
 from memory import MemorySystem
 from security import SecuritySystem
+from Backend.Resilience import call_with_retry, CircuitOpenError
+from Backend.ChatLogStore import chat_log_store
+from Backend.ContextWindow import context_window
+from Backend.LiveData import live_data
 
 
 security = SecuritySystem
@@ -39,95 +41,9 @@ SystemChatBot = [{"role": "system", "content": System}]
 if not os.path.exists("Data"):
     os.makedirs("Data")
 
-chat_log_path = r"Data\ChatLog.json"
-if not os.path.exists(chat_log_path):
-    with open(chat_log_path, "w") as f:
-        json.dump([], f)
-        
 def load_chat_history():
-    with open(chat_log_path, "r") as f:
-        return json.load(f)
-
-def save_chat_history(chat_history):
-    with open(chat_log_path, "w") as f:
-        json.dump(chat_history, f, indent=4)
-        
-
-def get_gps_location():
-    """
-    Get the current location based on GPS (or IP fallback if GPS is unavailable).
-    """
-    g = geocoder.ip('me')  
-
-    if g.latlng:
-        latitude, longitude = g.latlng
-        city = g.city
-        region = g.state
-        country = g.country
-        return latitude, longitude, city, region, country
-    else:
+    return chat_log_store.tail(context_window.history_limit)
         
-        return get_ipinfo_location()
-
-def get_ipinfo_location():
-    """
-    Get the location information from IPinfo API in case GPS is unavailable.
-    """
-    ip_info_url = "http://ipinfo.io/json"
-    try:
-        response = requests.get(ip_info_url)
-        location_data = response.json()
-        loc = location_data.get("loc", "0,0")  
-        latitude, longitude = loc.split(",")
-        city = location_data.get("city", "Unknown City")
-        region = location_data.get("region", "Unknown Region")
-        country = location_data.get("country", "Unknown Country")
-
-        return latitude, longitude, city, region, country
-    except requests.exceptions.RequestException as e:
-        print(f"Error getting IP location: {e}")
-        return None, None, "Unknown City", "Unknown Region", "Unknown Country"
-
-def fetch_live_data():
-    """
-    Fetch live weather data using the user's GPS or IP-based location and OpenWeatherMap API.
-    """
-    latitude, longitude, city, region, country = get_gps_location()
-
-    if latitude and longitude:
-        api_key = "eba808053e1f060966d57f79d4b5f08a"
-        url = f"http://api.openweathermap.org/data/2.5/weather?lat={latitude}&lon={longitude}&appid={api_key}&units=metric"
-
-        try:
-            response = requests.get(url)
-            data = response.json()
-
-            if data.get("weather"):
-                weather_description = data["weather"][0]["description"]
-                temperature = data["main"]["temp"]
-                humidity = data["main"]["humidity"]
-                pressure = data["main"]["pressure"]
-                wind_speed = data["wind"]["speed"]
-                cloudiness = data["clouds"]["all"]
-
-                weather_info = (
-                    f"Location: {city}, {region}, {country}\n"
-                    f"Weather: {weather_description}\n"
-                    f"Temperature: {temperature}°C\n"
-                    f"Humidity: {humidity}%\n"
-                    f"Pressure: {pressure} hPa\n"
-                    f"Wind Speed: {wind_speed} m/s\n"
-                    f"Cloudiness: {cloudiness}%"
-                )
-
-                return weather_info
-            else:
-                return "Weather data not available."
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching weather data: {e}")
-            return "Could not fetch weather data."
-    else:
-        return "Could not determine location."
 
 def Information():
     current_date_time = datetime.datetime.now()
@@ -140,7 +56,7 @@ def Information():
     minute = current_date_time.strftime('%M')
     second = current_date_time.strftime('%S')
 
-    weather = fetch_live_data()
+    weather = live_data.weather_summary()
 
     info = "Use the Real-time Information if needed:\n"
     info += f"Day : {day}\n"
@@ -158,77 +74,95 @@ def AnswerModifier(Answer):
     non_empty_lines = [line.strip() for line in lines if line.strip()]
     return "\n".join(non_empty_lines)
 
-def ChatBot(Query):
-    try:
-        if security.requires_auth(Query):
-            if not security.authenticate():
-                return "❌ Access denied. Wrong password."
-            else:
-                security.log(f"[AUTH] Sensitive command authorized: {Query}")
-                
-        lower_query = Query.lower()
-
-        if lower_query.startswith("remember that"):
-            fact = Query[len("remember that"):].strip()
-            if ":" in fact:
-                key, value = fact.split(":", 1)
-            elif " is " in fact:
-                key, value = fact.split(" is ", 1)
-            else:
-                return "❌ Please use: 'Remember that X is Y' or 'X: Y'"
-            memory.remember(key.strip(), value.strip())
-            return f"✅ Got it! I'll remember that {key.strip()} is {value.strip()}."
-
-        elif lower_query.startswith("forget"):
-            key = Query[len("forget"):].strip()
-            if memory.forget(key):
-                return f"🧹 Forgotten '{key}' from memory."
-            else:
-                return f"❌ I don’t remember anything by '{key}'."
-
-        elif "what do you remember" in lower_query or "show memory" in lower_query:
-            if not memory.memory:
-                return "🤷 I don’t remember anything yet."
-            return "\n".join([f"{k}: {v}" for k, v in memory.memory.items()])
-
-
-        recalled = memory.recall(Query)
-        if recalled:
-            memory_hint = f"\nNote: Remembered info {recalled}"
+def ChatBotStream(Query):
+    """Yield the answer token by token and save the turn once it is complete."""
+    if security.requires_auth(Query):
+        if not security.authenticate():
+            yield "❌ Access denied. Wrong password."
+            return
         else:
-            memory_hint = ""
-            
-            
-        chat_history = load_chat_history()
-        chat_history.append({"role": "user", "content": Query})
+            security.log(f"[AUTH] Sensitive command authorized: {Query}")
             
-        completion = client.chat.completions.create(
-            model="llama3-70b-8192",
-            messages=SystemChatBot + chat_history,
-            max_tokens=1024,
-            temperature=0.7,
-            top_p=1,
-            stream=True,
-            stop=None    
-        )
+    lower_query = Query.lower()
+
+    if lower_query.startswith("remember that"):
+        fact = Query[len("remember that"):].strip()
+        if ":" in fact:
+            key, value = fact.split(":", 1)
+        elif " is " in fact:
+            key, value = fact.split(" is ", 1)
+        else:
+            yield "❌ Please use: 'Remember that X is Y' or 'X: Y'"
+            return
+        memory.remember(key.strip(), value.strip())
+        yield f"✅ Got it! I'll remember that {key.strip()} is {value.strip()}."
+        return
+
+    elif lower_query.startswith("forget"):
+        key = Query[len("forget"):].strip()
+        if memory.forget(key):
+            yield f"🧹 Forgotten '{key}' from memory."
+        else:
+            yield f"❌ I don’t remember anything by '{key}'."
+        return
+
+    elif "what do you remember" in lower_query or "show memory" in lower_query:
+        if not memory.memory:
+            yield "🤷 I don’t remember anything yet."
+        else:
+            yield "\n".join([f"{k}: {v}" for k, v in memory.memory.items()])
+        return
+
+
+    recalled = memory.recall(Query)
+    if recalled:
+        memory_hint = f"\nNote: Remembered info {recalled}"
+    else:
+        memory_hint = ""
         
-        Answer = ""
         
-        for chunk in completion:
-            if chunk.choices[0].delta.content:
-                Answer += chunk.choices[0].delta.content
-                
-        Answer = Answer.replace("</s>", "")  
+    messages, _ = context_window.build(
+        SystemChatBot, load_chat_history(), [{"role": "user", "content": Query}], label="ChatBot"
+    )
         
-        chat_history.append({"role": "assistant", "content": Answer})
-        save_chat_history(chat_history)
+    completion = call_with_retry(
+        "groq",
+        client.chat.completions.create,
+        model="llama3-70b-8192",
+        messages=messages,
+        max_tokens=1024,
+        temperature=0.7,
+        top_p=1,
+        stream=True,
+        stop=None    
+    )
+    
+    Answer = ""
+    
+    try:
+        for chunk in completion:
+            token = chunk.choices[0].delta.content
+            if token:
+                token = token.replace("</s>", "")
+                Answer += token
+                yield token
+    finally:
+        # An answer cut short by the user is saved as far as it was spoken
+        if Answer:
+            chat_log_store.append_turn(Query, Answer)
+
+def ChatBot(Query):
+    try:
+        Answer = "".join(ChatBotStream(Query))
         return AnswerModifier(Answer=Answer)    
     
+    except CircuitOpenError as e:
+        print(f"Error: {e}")
+        return "I can't reach my language model right now. Please try again in a moment."
+
     except Exception as e:
         print(f"Error: {e}")
-        with open(r"Data\ChatLog.json", "w") as f:
-            dump([], f, indent=4)
-        return ChatBot(Query)
+        return "Sorry, something went wrong while answering that."
 
 
 if __name__ == "__main__":
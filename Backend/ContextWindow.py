@@ -0,0 +1,101 @@
+# Context Window Manager for Supriya Assistant
+# Keeps chat prompts inside the model's token budget
+
+import threading
+from typing import Dict, List, Optional, Tuple
+from dotenv import dotenv_values
+
+env_vars = dotenv_values(".env")
+
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for English text, about four characters per token"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def message_tokens(message: Dict) -> int:
+    """Estimated tokens of one chat message including role overhead"""
+    return estimate_tokens(message.get("content", "")) + MESSAGE_OVERHEAD_TOKENS
+
+class ContextWindow:
+    def __init__(self, budget: int = 6000, history_limit: int = 200, summary_tokens: int = 200):
+        # llama3-70b-8192 leaves about 6k tokens for the prompt after a 1024 token answer
+        self.budget = budget
+        self.history_limit = history_limit
+        self.summary_tokens = summary_tokens
+        self.last_stats: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def build(self, system_messages: List[Dict], history: List[Dict], query_messages: List[Dict],
+              label: str = "chat") -> Tuple[List[Dict], Dict[str, int]]:
+        """Assemble system + recent history + query messages within the budget"""
+        fixed_tokens = sum(message_tokens(m) for m in list(system_messages) + list(query_messages))
+        remaining = self.budget - fixed_tokens
+
+        # Leave room for the summary note when older turns will be dropped
+        reserved = self.summary_tokens if sum(message_tokens(m) for m in history) > remaining else 0
+        remaining -= reserved
+
+        kept = []
+        for message in reversed(history):
+            cost = message_tokens(message)
+            if cost > remaining:
+                break
+            kept.append(message)
+            remaining -= cost
+        kept.reverse()
+
+        # Never start the kept history halfway through a turn
+        while kept and kept[0].get("role") == "assistant":
+            remaining += message_tokens(kept.pop(0))
+
+        remaining += reserved
+        dropped = history[:len(history) - len(kept)]
+        summary = self._summarize(dropped, remaining) if dropped else None
+
+        messages = list(system_messages)
+        if summary:
+            messages.append(summary)
+        messages += kept + list(query_messages)
+
+        stats = {
+            "prompt_tokens": sum(message_tokens(m) for m in messages),
+            "budget": self.budget,
+            "kept_messages": len(kept),
+            "dropped_messages": len(dropped),
+        }
+        with self._lock:
+            self.last_stats = stats
+
+        print(f"🧮 {label} prompt: ~{stats['prompt_tokens']}/{self.budget} tokens, "
+              f"{stats['kept_messages']} history messages kept, {stats['dropped_messages']} dropped")
+        return messages, stats
+
+    def _summarize(self, dropped: List[Dict], remaining: int) -> Optional[Dict]:
+        """Compress dropped turns into a short note listing what the user asked earlier"""
+        allowance = min(self.summary_tokens, remaining) - MESSAGE_OVERHEAD_TOKENS
+        if allowance <= 0:
+            return None
+
+        header = "Earlier in this conversation the user asked about: "
+        max_chars = allowance * CHARS_PER_TOKEN - len(header)
+        topics = []
+        used = 0
+        for message in reversed(dropped):
+            if message.get("role") != "user":
+                continue
+            topic = " ".join(message.get("content", "").split())[:80]
+            if not topic:
+                continue
+            if used + len(topic) + 2 > max_chars:
+                break
+            topics.append(topic)
+            used += len(topic) + 2
+
+        if not topics:
+            return None
+        return {"role": "system", "content": header + "; ".join(reversed(topics))}
+
+# Global context window instance
+context_window = ContextWindow(budget=int(env_vars.get("ContextTokenBudget") or 6000))
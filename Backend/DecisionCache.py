@@ -0,0 +1,101 @@
+# Decision Cache for Supriya Assistant
+# Remembers Decision-Making Model results for repeated commands across restarts
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+# Decisions that depend on the moment they are asked must always be re-classified
+TIME_SENSITIVE_PREFIXES = ("realtime",)
+
+def normalize_query(query: str) -> str:
+    """Normalize a query the way QueryModifier does, minus the cosmetic punctuation"""
+    return " ".join(query.lower().split()).rstrip(".?!").strip()
+
+class DecisionCache:
+    def __init__(self, cache_file: str = "Data/DecisionCache.json", max_entries: int = 512,
+                 ttl_seconds: int = 7 * 24 * 3600):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        self.entries = self._load_entries()
+
+    def get(self, prompt: str) -> Optional[List[str]]:
+        """Get the cached decision list for a prompt if it is still fresh"""
+        key = normalize_query(prompt)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry and time.time() - entry["created_at"] <= self.ttl_seconds:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return list(entry["decisions"])
+
+            if entry:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, prompt: str, decisions: List[str]) -> bool:
+        """Cache a decision list unless it contains time-sensitive entries"""
+        if not decisions or any(d.lower().startswith(TIME_SENSITIVE_PREFIXES) for d in decisions):
+            return False
+
+        key = normalize_query(prompt)
+        if not key:
+            return False
+
+        with self._lock:
+            self.entries[key] = {"decisions": list(decisions), "created_at": time.time()}
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self._save_entries()
+        return True
+
+    def clear(self):
+        """Remove all cached decisions"""
+        with self._lock:
+            self.entries.clear()
+            self._save_entries()
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache size and hit/miss counters"""
+        with self._lock:
+            return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+    def _load_entries(self) -> OrderedDict:
+        """Load cached decisions from file, dropping expired ones"""
+        entries = OrderedDict()
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"❌ Error loading decision cache: {e}")
+                return entries
+
+            now = time.time()
+            for key, entry in data:
+                if now - entry["created_at"] <= self.ttl_seconds:
+                    entries[key] = entry
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+        return entries
+
+    def _save_entries(self):
+        """Save cached decisions to file in LRU order"""
+        temp_file = f"{self.cache_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(list(self.entries.items()), f)
+        os.replace(temp_file, self.cache_file)
+
+# Global decision cache instance
+decision_cache = DecisionCache()
@@ -16,6 +16,7 @@ import datetime
 from dotenv import dotenv_values
 import re
 from Backend.security import SecuritySystem
+from Backend.StartupProfiler import startup_profiler
 
 env_vars = dotenv_values(".env")
 
@@ -469,7 +470,8 @@ Best regards,
             json.dump(self.templates, f, indent=4, ensure_ascii=False)
 
 # Global email manager instance
-email_manager = EmailManager()
+with startup_profiler.span("email_manager"):
+    email_manager = EmailManager()
 
 # Voice command functions for email management
 def read_emails_voice(command: str):
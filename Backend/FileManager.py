@@ -15,6 +15,7 @@ from dataclasses import dataclass, asdict
 import threading
 import time
 from Backend.security import SecuritySystem
+from Backend.StartupProfiler import startup_profiler
 
 @dataclass
 class FileInfo:
@@ -530,7 +531,8 @@ class FileManager:
             json.dump(self.bookmarks, f, indent=4)
 
 # Global file manager instance
-file_manager = FileManager()
+with startup_profiler.span("file_manager"):
+    file_manager = FileManager()
 
 # Voice command functions for file management
 def list_files_voice(command: str):
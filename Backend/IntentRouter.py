@@ -0,0 +1,148 @@
+# Local Intent Router for Supriya Assistant
+# Answers unambiguous commands locally before the remote Decision-Making Model is consulted
+
+import re
+import threading
+from typing import Dict, List, Optional
+
+# (category, pattern, decision template, free text target)
+# Patterns mirror the rules of the Decision-Making Model preamble and are tried in order
+INTENT_RULES = [
+    ("exit", r"(?:bye|goodbye|good bye)(?: \w+)?|exit|quit", "exit", False),
+    ("general", r"what(?:'s| is) the (?:time|date|day)(?: today| now)?|what day is (?:it|today)", "general {query}", False),
+    ("general", r"(?:hi|hello|hey|how are you|thank you|thanks)", "general {query}", False),
+    ("system", r"(?:turn )?(?:the )?volume up|(?:increase|raise) (?:the )?volume|louder", "system volume up", False),
+    ("system", r"(?:turn )?(?:the )?volume down|(?:decrease|lower|reduce) (?:the )?volume|quieter", "system volume down", False),
+    ("system", r"(?:un)?mute(?: the)?(?: system| volume| sound)?", "system mute", False),
+    ("system", r"(?:the )?brightness up|(?:increase|raise) (?:the )?(?:screen )?brightness", "system brightness up", False),
+    ("system", r"(?:the )?brightness down|(?:decrease|lower|reduce) (?:the )?(?:screen )?brightness", "system brightness down", False),
+    ("system", r"shut ?down (?:the |my )?(?:computer|pc|system)|turn off (?:the |my )?(?:computer|pc)", "system shutdown", False),
+    ("system", r"(?:restart|reboot) (?:the |my )?(?:computer|pc|system)", "system restart", False),
+    ("system", r"(?:take (?:a )?)?screenshot|capture (?:the )?screen", "system screenshot", False),
+    ("system", r"(?:show|read) (?:from )?(?:the |my )?clipboard", "system clipboard", False),
+    ("system", r"open (?:the )?(?:camera|webcam)|take (?:a )?photo from (?:the )?webcam", "system webcam", False),
+    ("media", r"(?P<action>pause|resume|stop) (?:the )?(?:song|music|track)", "media {action} music", False),
+    ("media", r"(?:play )?(?:the )?(?P<action>next|previous) (?:song|track)", "media {action} track", False),
+    ("media", r"play (?:some )?music", "media play music", False),
+    ("open", r"open (?P<target>.+)", "open {target}", False),
+    ("close", r"close (?P<target>.+)", "close {target}", False),
+    ("play", r"play (?P<target>.+)", "play {target}", True),
+    ("google search", r"(?:google search|search google for) (?P<target>.+)", "google search {target}", True),
+    ("youtube search", r"(?:youtube search|search youtube for) (?P<target>.+)", "youtube search {target}", True),
+    ("generate image", r"generate (?:an? )?image(?: of)? (?P<target>.+)", "generate image {target}", True),
+]
+
+# Categories whose bare follow-up clause ("open chrome and firefox") inherits the verb
+LIST_CATEGORIES = ("open", "close")
+
+POLITE_PREFIXES = ("please ", "can you ", "could you ", "would you ", "will you ")
+
+# Words that make a target look like a sentence rather than a name
+TARGET_STOPWORDS = {
+    "me", "my", "about", "tell", "what", "who", "how", "why", "when", "where",
+    "is", "are", "was", "do", "does", "you", "your", "it", "this", "that", "then",
+}
+
+class IntentRouter:
+    def __init__(self, funcs: List[str], max_target_words: int = 4):
+        self.max_target_words = max_target_words
+        self.rules = [
+            (category, re.compile(pattern), template, free_text)
+            for category, pattern, template, free_text in INTENT_RULES
+            if category in funcs
+        ]
+        self.free_text_categories = {category for category, _, _, free_text in self.rules if free_text}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def route(self, prompt: str) -> Optional[List[str]]:
+        """Return the decision list for a high-confidence command, or None when unsure"""
+        decisions = self._route(self._normalize(prompt))
+        with self._lock:
+            if decisions:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return decisions
+
+    def stats(self) -> Dict[str, float]:
+        """Get hit/miss counters of the local router"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0
+            }
+
+    def _route(self, text: str) -> Optional[List[str]]:
+        if not text:
+            return None
+
+        decisions = []
+        for piece in text.split(","):
+            piece = piece.strip()
+            if not piece:
+                continue
+
+            # The whole piece goes through the rules in priority order first, so "play next song"
+            # stays a media command; only song names and search topics may keep an "and"
+            decision = self._match(piece)
+            if decision and (" and " not in piece or self._keeps_and(decision, piece)):
+                decisions.append(decision)
+                continue
+
+            previous = None
+            for clause in piece.split(" and "):
+                clause = clause.strip()
+                decision = self._match(clause)
+                if decision is None and previous in LIST_CATEGORIES and self._valid_target(clause):
+                    decision = (previous, f"{previous} {clause}")
+                if decision is None:
+                    return None
+                previous = decision[0]
+                decisions.append(decision)
+
+        return [decision for _, decision in decisions] or None
+
+    def _keeps_and(self, decision, piece: str) -> bool:
+        """A free-text target keeps its "and" unless what follows is a command of its own"""
+        if decision[0] not in self.free_text_categories:
+            return False
+        # "play despacito and open chrome" is two commands, "play tom and jerry" is one
+        return not any(self._match(clause.strip()) for clause in piece.split(" and ")[1:])
+
+    def _match(self, clause: str):
+        for category, pattern, template, free_text in self.rules:
+            match = pattern.fullmatch(clause)
+            if not match:
+                continue
+            groups = match.groupdict()
+            target = groups.get("target")
+            if target is not None and not free_text and not self._valid_target(target):
+                return None
+            return category, template.format(query=clause, **groups)
+        return None
+
+    def _valid_target(self, target: str) -> bool:
+        words = target.split()
+        if not words or len(words) > self.max_target_words:
+            return False
+        if not re.fullmatch(r"[\w .+\-']+", target):
+            return False
+        return not any(word in TARGET_STOPWORDS for word in words)
+
+    def _normalize(self, prompt: str) -> str:
+        text = " ".join(prompt.lower().split())
+        text = text.rstrip(".?! ")
+        changed = True
+        while changed:
+            changed = False
+            for prefix in POLITE_PREFIXES:
+                if text.startswith(prefix):
+                    text = text[len(prefix):]
+                    changed = True
+        if text.endswith(" please"):
+            text = text[:-len(" please")]
+        return text.strip(" ,")
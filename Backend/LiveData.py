@@ -0,0 +1,154 @@
+# Live Data Provider for Supriya Assistant
+# Refreshes location and weather in the background and serves cached values instantly
+
+import datetime
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+import geocoder
+import requests
+from dotenv import dotenv_values
+
+env_vars = dotenv_values(".env")
+
+@dataclass
+class Location:
+    latitude: str
+    longitude: str
+    city: str
+    region: str
+    country: str
+
+class LiveDataProvider:
+    def __init__(self, weather_api_key: Optional[str], location_interval: int = 6 * 3600,
+                 weather_interval: int = 15 * 60, request_timeout: float = 5.0):
+        self.weather_api_key = weather_api_key
+        self.location_interval = location_interval
+        self.weather_interval = weather_interval
+        self.request_timeout = request_timeout
+
+        # One pooled session for geocoding, ipinfo and weather requests
+        self.session = requests.Session()
+
+        self.location: Optional[Location] = None
+        self.location_updated_at: Optional[float] = None
+        self.weather: Optional[str] = None
+        self.weather_updated_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+        # Start refresh thread
+        self.refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        self.refresh_thread.start()
+
+    def weather_summary(self) -> str:
+        """Get the cached weather report with its age, without any network call"""
+        with self._lock:
+            weather = self.weather
+            updated_at = self.weather_updated_at
+
+        if not weather:
+            return "Weather data not available yet."
+        return f"{weather}\nUpdated: {self._describe_age(updated_at)}"
+
+    def refresh(self):
+        """Refresh location and weather now"""
+        self._refresh_location()
+        self._refresh_weather()
+
+    def stop(self):
+        """Stop the background refresh thread"""
+        self._stop_event.set()
+
+    def _refresh_loop(self):
+        """Refresh location and weather whenever they are due"""
+        while not self._stop_event.is_set():
+            now = time.time()
+            try:
+                if self.location_updated_at is None or now - self.location_updated_at >= self.location_interval:
+                    self._refresh_location()
+                if self.weather_updated_at is None or now - self.weather_updated_at >= self.weather_interval:
+                    self._refresh_weather()
+            except Exception as e:
+                print(f"❌ Error refreshing live data: {e}")
+
+            self._stop_event.wait(min(self.location_interval, self.weather_interval))
+
+    def _refresh_location(self):
+        """Look up location by IP, falling back to ipinfo.io"""
+        location = None
+        try:
+            g = geocoder.ip('me', session=self.session, timeout=self.request_timeout)
+            if g.latlng:
+                latitude, longitude = g.latlng
+                location = Location(str(latitude), str(longitude), g.city, g.state, g.country)
+        except Exception as e:
+            print(f"Error getting GPS location: {e}")
+
+        if location is None:
+            location = self._ipinfo_location()
+
+        if location:
+            with self._lock:
+                self.location = location
+                self.location_updated_at = time.time()
+
+    def _ipinfo_location(self) -> Optional[Location]:
+        """Get the location information from IPinfo API"""
+        try:
+            response = self.session.get("http://ipinfo.io/json", timeout=self.request_timeout)
+            location_data = response.json()
+            latitude, longitude = location_data.get("loc", "0,0").split(",")
+            return Location(
+                latitude,
+                longitude,
+                location_data.get("city", "Unknown City"),
+                location_data.get("region", "Unknown Region"),
+                location_data.get("country", "Unknown Country")
+            )
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Error getting IP location: {e}")
+            return None
+
+    def _refresh_weather(self):
+        """Fetch current weather for the cached location from OpenWeatherMap"""
+        with self._lock:
+            location = self.location
+
+        if not location or not self.weather_api_key:
+            return
+
+        url = (f"http://api.openweathermap.org/data/2.5/weather?lat={location.latitude}"
+               f"&lon={location.longitude}&appid={self.weather_api_key}&units=metric")
+        try:
+            data = self.session.get(url, timeout=self.request_timeout).json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Error fetching weather data: {e}")
+            return
+
+        if not data.get("weather"):
+            return
+
+        weather_info = (
+            f"Location: {location.city}, {location.region}, {location.country}\n"
+            f"Weather: {data['weather'][0]['description']}\n"
+            f"Temperature: {data['main']['temp']}°C\n"
+            f"Humidity: {data['main']['humidity']}%\n"
+            f"Pressure: {data['main']['pressure']} hPa\n"
+            f"Wind Speed: {data['wind']['speed']} m/s\n"
+            f"Cloudiness: {data['clouds']['all']}%"
+        )
+        with self._lock:
+            self.weather = weather_info
+            self.weather_updated_at = time.time()
+
+    def _describe_age(self, updated_at: float) -> str:
+        minutes = int((time.time() - updated_at) // 60)
+        stamp = datetime.datetime.fromtimestamp(updated_at).strftime("%H:%M")
+        if minutes < 1:
+            return f"just now ({stamp})"
+        return f"{minutes} minutes ago ({stamp})"
+
+# Global live data provider instance
+live_data = LiveDataProvider(env_vars.get("WeatherAPIKey"))
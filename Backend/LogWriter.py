@@ -0,0 +1,110 @@
+# Background Log Writer for Supriya Assistant
+# Queues log lines from any thread and appends them in batches, rotating files by size and day
+
+import atexit
+import datetime
+import os
+import queue
+import threading
+from collections import defaultdict
+from typing import Dict, List
+
+class LogWriter:
+    def __init__(self, flush_interval: float = 1.0, batch_size: int = 200,
+                 max_bytes: int = 1024 * 1024, backup_count: int = 5, rotate_daily: bool = True):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.rotate_daily = rotate_daily
+
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def write(self, path: str, line: str):
+        """Queue one line for path; returns immediately"""
+        self._queue.put((path, line.rstrip("\n") + "\n"))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until every line queued so far is on disk"""
+        if not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def stop(self):
+        """Write what is left and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+    def _run(self):
+        running = True
+        while running:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            # Gather whatever else arrives within the flush interval into one batch
+            batch: Dict[str, List[str]] = defaultdict(list)
+            waiters = []
+            while True:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    path, line = item
+                    batch[path].append(line)
+
+                if not running or waiters or sum(map(len, batch.values())) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=0.05)
+                except queue.Empty:
+                    break
+
+            for path, lines in batch.items():
+                self._append(path, lines)
+            for done in waiters:
+                done.set()
+
+    def _append(self, path: str, lines: List[str]):
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if self._should_rotate(path):
+                self._rotate(path)
+            with open(path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+        except OSError as e:
+            print(f"❌ Error writing log {path}: {e}")
+
+    def _should_rotate(self, path: str) -> bool:
+        if not os.path.exists(path):
+            return False
+        if os.path.getsize(path) >= self.max_bytes:
+            return True
+        if self.rotate_daily:
+            last_write = datetime.date.fromtimestamp(os.path.getmtime(path))
+            return last_write < datetime.date.today()
+        return False
+
+    def _rotate(self, path: str):
+        """Shift path.1 .. path.N up by one and move path to path.1, dropping the oldest"""
+        if self.backup_count <= 0:
+            os.remove(path)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{path}.{index + 1}")
+        os.replace(path, f"{path}.1")
+
+# Global log writer instance
+log_writer = LogWriter()
@@ -22,6 +22,7 @@ import cv2
 import numpy as np
 from PIL import Image, ImageTk
 import webbrowser
+from Backend.StartupProfiler import startup_profiler
 
 @dataclass
 class MediaFile:
@@ -667,7 +668,8 @@ class MediaController:
             json.dump(self.settings, f, indent=4)
 
 # Global media controller instance
-media_controller = MediaController()
+with startup_profiler.span("media_controller"):
+    media_controller = MediaController()
 
 # Voice command functions for media control
 def play_music_voice(command: str):
@@ -3,6 +3,9 @@ from rich import print
 from dotenv import dotenv_values
 import random
 import time
+from Backend.IntentRouter import IntentRouter
+from Backend.DecisionCache import decision_cache
+from Backend.Resilience import call_with_retry, InvalidResponseError
 
 
 env_vars = dotenv_values(".env")
@@ -22,6 +25,8 @@ funcs = [
     "backup", "security", "network", "schedule", "note"
 ]
 
+intent_router = IntentRouter(funcs)
+
 ChatHistory = [
     {"role": "User", "message": "how are you?"},
     {"role": "Chatbot", "message": "general how are you?"},
@@ -79,38 +84,49 @@ You will decide whether a query is a 'general' query, a 'realtime' query, or is
 """
 
 
-def FirstLayerDMM(prompt: str = "test", retries: int = 0, max_retries: int = 3):
-    fallback_response = ["general (query)"]
+def ClassifyWithCohere(prompt: str):
+    stream = co.chat_stream(
+        model='command-r-plus',
+        message=prompt,
+        temperature=0.7,
+        chat_history=ChatHistory,
+        prompt_truncation='OFF',
+        connectors=[],
+        preamble=preamble
+    )
 
-    if retries > max_retries:
-        return fallback_response
+    response = ""
+    for event in stream:
+        if event.event_type == "text-generation":
+            response += event.text
+
+    response = response.replace("\n", "").split(",")
+    response = [task.strip() for task in response if any(task.strip().startswith(func) for func in funcs)]
+
+    if not response or "(query)" in response[0].lower():
+        raise InvalidResponseError(f"Unusable decision for '{prompt}'")
+
+    return response
+
+
+def FirstLayerDMM(prompt: str = "test", max_retries: int = 3):
+    fallback_response = ["general (query)"]
 
     if not prompt or not prompt.strip():
         print("[yellow]Empty prompt received. Skipping Cohere call.[/yellow]")
         return fallback_response
 
-    try:
-        stream = co.chat_stream(
-            model='command-r-plus',
-            message=prompt,
-            temperature=0.7,
-            chat_history=ChatHistory,
-            prompt_truncation='OFF',
-            connectors=[],
-            preamble=preamble
-        )
-
-        response = ""
-        for event in stream:
-            if event.event_type == "text-generation":
-                response += event.text
-
-        response = response.replace("\n", "").split(",")
-        response = [task.strip() for task in response if any(task.strip().startswith(func) for func in funcs)]
-
-        if not response or "(query)" in response[0].lower():
-            return FirstLayerDMM(prompt=prompt, retries=retries + 1)
+    local_decision = intent_router.route(prompt)
+    if local_decision:
+        return local_decision
+
+    cached_decision = decision_cache.get(prompt)
+    if cached_decision:
+        return cached_decision
 
+    try:
+        response = call_with_retry("cohere", ClassifyWithCohere, prompt, max_attempts=max_retries + 1)
+        decision_cache.put(prompt, response)
         return response
 
     except Exception as e:
@@ -134,6 +150,8 @@ if __name__ == "__main__":
             try:
                 response = FirstLayerDMM(user_input)
                 print("[green]Response:[/green]", response)
+                print("[cyan]Local router:[/cyan]", intent_router.stats())
+                print("[cyan]Decision cache:[/cyan]", decision_cache.stats())
             except Exception as e:
                 print(f"[bold red]❌ Error while processing input: {e}[/bold red]")
 
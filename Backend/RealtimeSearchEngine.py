@@ -1,13 +1,16 @@
 # Dont Forgot To give Respect To Me(Arya) If you use It 
 
-from googlesearch import search
 from groq import Groq
 from json import load, dump
 import os
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import dotenv_values
-import requests
-import geocoder
+from Backend.Resilience import call_with_retry
+from Backend.ChatLogStore import chat_log_store
+from Backend.ContextWindow import context_window
+from Backend.LiveData import live_data
+from Backend.WebSearch import web_search
 
 env_vars = dotenv_values(".env")
 Username = env_vars.get("Username")
@@ -28,23 +31,20 @@ System = f"""Hello, I am {Username}, You are a very accurate and advanced AI cha
 *** Just answer the question from the provided data in a professional way. ***"""
 
 
-SystemChatBot = [{"role": "system", "content": System}]
-
 if not os.path.exists("Data"):
     os.makedirs("Data")
 
-chat_log_path = r"Data\ChatLog.json"
-if not os.path.exists(chat_log_path):
-    with open(chat_log_path, "w") as f:
-        dump([], f)
         
         
 def GoogleSearch(query):
-    result = list(search(query, advanced=True, num_results=5))
+    result = web_search.search(query)
     Answer = f"The Search result for '{query}' are:\n[start]\n"
     
     for i in result:
-        Answer += f"Title:{i.title}\nDescription: {i.description}\n\n"
+        Answer += f"Title:{i.title}\nDescription: {i.description}\n"
+        if i.content:
+            Answer += f"Content: {i.content}\n"
+        Answer += "\n"
         
     Answer +="[end]"
     return Answer
@@ -55,87 +55,12 @@ def AnswerModifier(Answer):
     non_empty_lines = [line for line in lines if line.strip()]
     return "\n".join(non_empty_lines)
 
-SystemChatBot=[
+# Shared read-only prompt prefix; each request builds its own message list on top of it
+SystemChatBot = (
     {"role": "system","content": System},
     {"role": "user","content":"Hi"},
     {"role": "assistant","content":"Hello , how can i help you?"}
-]
-
-def get_gps_location():
-    """
-    Get the current location based on GPS (or IP fallback if GPS is unavailable).
-    """
-    g = geocoder.ip('me')  
-
-    if g.latlng:
-        latitude, longitude = g.latlng
-        city = g.city
-        region = g.state
-        country = g.country
-        return latitude, longitude, city, region, country
-    else:
-        
-        return get_ipinfo_location()
-
-def get_ipinfo_location():
-    """
-    Get the location information from IPinfo API in case GPS is unavailable.
-    """
-    ip_info_url = "http://ipinfo.io/json"
-    try:
-        response = requests.get(ip_info_url)
-        location_data = response.json()
-        loc = location_data.get("loc", "0,0")  
-        latitude, longitude = loc.split(",")
-        city = location_data.get("city", "Unknown City")
-        region = location_data.get("region", "Unknown Region")
-        country = location_data.get("country", "Unknown Country")
-
-        return latitude, longitude, city, region, country
-    except requests.exceptions.RequestException as e:
-        print(f"Error getting IP location: {e}")
-        return None, None, "Unknown City", "Unknown Region", "Unknown Country"
-
-def fetch_live_data():
-    """
-    Fetch live weather data using the user's GPS or IP-based location and OpenWeatherMap API.
-    """
-    latitude, longitude, city, region, country = get_gps_location()
-
-    if latitude and longitude:
-        api_key = WeatherAPIKey
-        url = f"http://api.openweathermap.org/data/2.5/weather?lat={latitude}&lon={longitude}&appid={api_key}&units=metric"  
-
-        try:
-            response = requests.get(url)
-            data = response.json()
-
-            if data.get("weather"):
-                weather_description = data["weather"][0]["description"]
-                temperature = data["main"]["temp"]
-                humidity = data["main"]["humidity"]
-                pressure = data["main"]["pressure"]
-                wind_speed = data["wind"]["speed"]
-                cloudiness = data["clouds"]["all"]
-
-                weather_info = (
-                    f"Location: {city}, {region}, {country}\n"
-                    f"Weather: {weather_description}\n"
-                    f"Temperature: {temperature}°C\n"
-                    f"Humidity: {humidity}%\n"
-                    f"Pressure: {pressure} hPa\n"
-                    f"Wind Speed: {wind_speed} m/s\n"
-                    f"Cloudiness: {cloudiness}%"
-                )
-
-                return weather_info
-            else:
-                return "Weather data not available."
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching weather data: {e}")
-            return "Could not fetch weather data."
-    else:
-        return "Could not determine location."
+)
 
 def Information():
     current_date_time = datetime.datetime.now()
@@ -148,7 +73,7 @@ def Information():
     minute = current_date_time.strftime('%M')
     second = current_date_time.strftime('%S')
 
-    weather = fetch_live_data()
+    weather = live_data.weather_summary()
 
     info = "Use the Real-time Information if needed:\n"
     info += f"Day : {day}\n"
@@ -160,39 +85,70 @@ def Information():
     
     return info
     
+class RealtimeSearch:
+    """Re-entrant realtime answer engine; no state is shared between requests"""
+
+    def __init__(self, client, model="llama3-70b-8192", system_messages=SystemChatBot):
+        self.client = client
+        self.model = model
+        self.system_messages = tuple(system_messages)
+
+    def build_messages(self, prompt):
+        """Assemble a fresh message list for one request"""
+        search_message = {"role": "user", "content": GoogleSearch(prompt)}
+        messages, _ = context_window.build(
+            list(self.system_messages) + [search_message],
+            chat_log_store.tail(context_window.history_limit),
+            [{"role": "user", "content": f"{prompt}"}],
+            label="RealtimeSearchEngine"
+        )
+        return messages
+
+    def stream(self, prompt):
+        """Yield the grounded answer token by token and save the turn once it is complete."""
+        completion = call_with_retry(
+            "groq",
+            self.client.chat.completions.create,
+            model=self.model,
+            messages=self.build_messages(prompt),
+            max_tokens=1024,
+            temperature=0.7,
+            top_p=1,
+            stream=True,
+            stop=None
+        )
+
+        Answer = ""
+
+        try:
+            for chunk in completion:
+                token = chunk.choices[0].delta.content
+                if token:
+                    token = token.replace("</s>", "")
+                    Answer += token
+                    yield token
+        finally:
+            # An answer cut short by the user is saved as far as it was spoken
+            if Answer:
+                chat_log_store.append_turn(prompt, Answer)
+
+    def answer(self, prompt):
+        """Get the complete grounded answer for a prompt"""
+        return AnswerModifier(Answer="".join(self.stream(prompt)))
+
+    def answer_many(self, prompts, max_workers=3):
+        """Answer several realtime prompts in parallel threads, keeping their order"""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.answer, prompts))
+
+# Global realtime search instance
+realtime_search = RealtimeSearch(client)
+
+def RealtimeSearchEngineStream(prompt):
+    return realtime_search.stream(prompt)
+
 def RealtimeSearchEngine(prompt):
-    global SystemChatBot, messages 
-    
-    with open(r"Data\ChatLog.json","r") as f:
-        message = load(f)
-    message.append({"role":"user","content": f"{prompt}"})
-    
-    SystemChatBot.append({"role":"user","content":GoogleSearch(prompt)})
-    
-    completion = client.chat.completions.create(
-        model="llama3-70b-8192",
-        messages=SystemChatBot + message,
-        max_tokens=1024,
-        temperature=0.7,
-        top_p=1,
-        stream=True,
-        stop=None    
-    )
-        
-    Answer = ""
-        
-    for chunk in completion:
-        if chunk.choices[0].delta.content:
-            Answer += chunk.choices[0].delta.content
-                
-    Answer = Answer.replace("</s>", "")  
-        
-    message.append({"role": "assistant", "content": Answer})
-    
-    with open(r"Data\ChatLog.json", "w") as f:
-        dump(message, f, indent=4)
-    SystemChatBot.pop()        
-    return AnswerModifier(Answer=Answer)   
+    return realtime_search.answer(prompt)
 
 if __name__ == "__main__":
     while True:
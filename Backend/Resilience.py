@@ -0,0 +1,148 @@
+# Retry and Circuit Breaker helpers for Supriya Assistant
+# Bounds retries of remote API calls and fails fast while a provider is down
+
+import random
+import socket
+import threading
+import time
+from enum import Enum
+from typing import Callable, Dict
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open"""
+
+class InvalidResponseError(Exception):
+    """Raised when a provider answered but the answer could not be used; retried without tripping the circuit"""
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Check whether a call may go through, moving to half-open once the timeout has passed"""
+        with self._lock:
+            if self.state == CircuitState.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = CircuitState.HALF_OPEN
+                self._trial_in_flight = False
+
+            if self.state == CircuitState.HALF_OPEN:
+                if self._trial_in_flight:
+                    return False
+                self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        """Close the circuit after a successful call"""
+        with self._lock:
+            if self.state != CircuitState.CLOSED:
+                print(f"✅ {self.name} is reachable again")
+            self.state = CircuitState.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a failed call and open the circuit once the threshold is reached"""
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != CircuitState.OPEN:
+                    print(f"🚨 {self.name} circuit opened after {self.failures} failures")
+                self.state = CircuitState.OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """End a call that says nothing about the provider's health without counting it"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def remaining_open_time(self) -> float:
+        """Seconds until an open circuit allows a trial call"""
+        with self._lock:
+            if self.state != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    """Get the shared circuit breaker of a provider"""
+    with _breakers_lock:
+        if provider not in _breakers:
+            _breakers[provider] = CircuitBreaker(provider)
+        return _breakers[provider]
+
+def backoff_delay(attempt: int, base_delay: float = 0.5, max_delay: float = 8.0) -> float:
+    """Full-jitter exponential backoff delay for a zero-based attempt number"""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+# SDK exception classes (groq, cohere, httpx, requests) are matched by name so none of them is imported here
+TRANSIENT_ERROR_NAMES = ("Connection", "Connect", "Timeout", "RateLimit", "ServiceUnavailable", "InternalServer")
+
+def error_status_code(error: BaseException):
+    """HTTP status carried by an SDK or requests error, if any"""
+    for source in (error, getattr(error, "response", None)):
+        for attribute in ("status_code", "http_status", "status"):
+            status = getattr(source, attribute, None)
+            if isinstance(status, int):
+                return status
+    return None
+
+def is_transient_error(error: BaseException) -> bool:
+    """Connection problems, timeouts, 429 and 5xx may succeed on retry; auth errors and other 4xx never do"""
+    status = error_status_code(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    if isinstance(error, (ConnectionError, TimeoutError, socket.gaierror)):
+        return True
+    return any(name in cls.__name__ for cls in type(error).__mro__ for name in TRANSIENT_ERROR_NAMES)
+
+def call_with_retry(provider: str, func: Callable, *args, max_attempts: int = 3, base_delay: float = 0.5,
+                    max_delay: float = 8.0, retry_if: Callable[[BaseException], bool] = is_transient_error, **kwargs):
+    """Call func with bounded jittered retries behind the provider's circuit breaker"""
+    breaker = get_breaker(provider)
+
+    for attempt in range(max_attempts):
+        if not breaker.allow_request():
+            raise CircuitOpenError(
+                f"{provider} is unavailable, retrying in {breaker.remaining_open_time():.0f}s"
+            )
+
+        try:
+            result = func(*args, **kwargs)
+        except InvalidResponseError as e:
+            breaker.record_success()
+            error = e
+        except Exception as e:
+            if not retry_if(e):
+                # The provider answered; retrying a bad key or a decommissioned model only wastes quota
+                breaker.release()
+                raise
+            breaker.record_failure()
+            error = e
+        except BaseException:
+            breaker.release()
+            raise
+        else:
+            breaker.record_success()
+            return result
+
+        print(f"⚠️ {provider} call failed (attempt {attempt + 1}/{max_attempts}): {error}")
+        if attempt == max_attempts - 1:
+            raise error
+        time.sleep(backoff_delay(attempt, base_delay, max_delay))
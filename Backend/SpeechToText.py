@@ -5,32 +5,49 @@ import os
 import datetime
 import wave
 import json
+import time
+import queue
+import threading
+from collections import deque
+from contextlib import contextmanager
+import numpy as np
 import speech_recognition as sr
 from vosk import Model, KaldiRecognizer
+from dotenv import dotenv_values
+from Backend.LogWriter import log_writer
+from Backend.StartupProfiler import startup_profiler
 
 VOSK_MODEL_PATH = "vosk-model-small-en-us-0.15"
 DATA_DIR = "audio"
 AUDIO_FILE = os.path.join(DATA_DIR, "audio.wav")
 LOG_FILE = os.path.join("logs", "history1.log")
 
-if not os.path.exists(VOSK_MODEL_PATH):
-    raise FileNotFoundError(f"Model not found at: {VOSK_MODEL_PATH}")
+# The assistant wakes up when it hears its own name unless WakeWord is set in .env
+env_vars = dotenv_values(".env")
+DEFAULT_WAKE_WORD = "assistant"
+WAKE_WORD = (env_vars.get("WakeWord") or env_vars.get("Assistantname") or DEFAULT_WAKE_WORD).strip().lower()
 
-model = Model(VOSK_MODEL_PATH)
+# Streaming capture settings
+SAMPLE_RATE = 16000
+FRAME_MS = 30
+FRAME_SAMPLES = SAMPLE_RATE * FRAME_MS // 1000
+PRE_ROLL_MS = 300
 
 os.makedirs("logs", exist_ok=True)
 os.makedirs("audio", exist_ok=True)
 
 def log_transcript(text):
     timestamp = datetime.datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(f"{timestamp} {text.strip()}\n")
+    log_writer.write(LOG_FILE, f"{timestamp} {text.strip()}")
 
 def listen_and_save(timeout=4, phrase_time_limit=7):
-    recognizer = sr.Recognizer()
+    recognizer = recognizer_service.sr_recognizer
     with sr.Microphone() as source:
         print("🎙 Listening...")
-        recognizer.adjust_for_ambient_noise(source, duration=0.3)
+        # Calibrate once; dynamic_energy_threshold keeps tracking the room afterwards
+        if not recognizer_service.sr_calibrated:
+            recognizer.adjust_for_ambient_noise(source, duration=0.3)
+            recognizer_service.sr_calibrated = True
         try:
             audio = recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
             with open(AUDIO_FILE, "wb") as f:
@@ -42,13 +59,14 @@ def listen_and_save(timeout=4, phrase_time_limit=7):
             print(f"❌ Error: {e}")
     return False
 
-def transcribe_audio():
-    wf = wave.open(AUDIO_FILE, "rb")
-    recognizer = KaldiRecognizer(model, wf.getframerate())
+def transcribe_wav(path, model=None, chunk_frames=4000):
+    """Run the Vosk recognition path over a WAV file and return the transcript"""
+    wf = wave.open(path, "rb")
+    recognizer = KaldiRecognizer(model or recognizer_service.model, wf.getframerate())
     final_text = ""
 
     while True:
-        data = wf.readframes(4000)
+        data = wf.readframes(chunk_frames)
         if len(data) == 0:
             break
         if recognizer.AcceptWaveform(data):
@@ -59,8 +77,10 @@ def transcribe_audio():
     final_result = recognizer.FinalResult()
     final_text += json.loads(final_result).get("text", "")
     wf.close()
+    return final_text.strip()
 
-    final_text = final_text.strip()
+def transcribe_audio():
+    final_text = transcribe_wav(AUDIO_FILE)
     if final_text:
         log_transcript(final_text)
         print(f"📝 You said: {final_text}")
@@ -68,7 +88,434 @@ def transcribe_audio():
         pass
     return final_text
 
-def SpeechRecognition():
+class EnergyVAD:
+    def __init__(self, threshold_ratio=3.0, min_threshold=300.0, start_frames=3, end_silence_ms=700):
+        self.threshold_ratio = threshold_ratio
+        self.min_threshold = min_threshold
+        self.start_frames = start_frames
+        self.end_silence_frames = max(1, end_silence_ms // FRAME_MS)
+        self.noise_floor = min_threshold / threshold_ratio
+
+    def frame_energy(self, frame):
+        samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+        return float(np.sqrt(np.mean(samples * samples))) if samples.size else 0.0
+
+    def threshold(self):
+        return max(self.min_threshold, self.noise_floor * self.threshold_ratio)
+
+    def is_speech(self, energy):
+        return energy > self.threshold()
+
+    def update_noise_floor(self, energy, alpha=0.05):
+        self.noise_floor = (1 - alpha) * self.noise_floor + alpha * energy
+
+    def observe(self, energy):
+        speech = self.is_speech(energy)
+        if not speech:
+            self.update_noise_floor(energy)
+        return speech
+
+class RecognizerService:
+    def __init__(self, model_path=VOSK_MODEL_PATH, ring_ms=3000):
+        self.model_path = model_path
+        self.vad = EnergyVAD()
+        self.sr_recognizer = sr.Recognizer()
+        self.sr_calibrated = False
+        # The most recent microphone audio, so speech that started before a listener joined can be replayed
+        self.ring = deque(maxlen=max(1, ring_ms // FRAME_MS))
+        self.frames_read = 0
+
+        self._model = None
+        self._model_error = None
+        self._model_ready = threading.Event()
+        self._model_thread = None
+        self._recognizer = None
+        self._recognizer_lock = threading.Lock()
+
+        self._listeners = []
+        self._listeners_lock = threading.Lock()
+        self._mic_thread = None
+        self._running = threading.Event()
+
+    def start(self):
+        """Warm the model and open the microphone in background threads"""
+        self.warm_up()
+        if self._mic_thread is None:
+            self._running.set()
+            self._mic_thread = threading.Thread(target=self._mic_loop, daemon=True)
+            self._mic_thread.start()
+
+    def stop(self):
+        """Stop reading the microphone"""
+        self._running.clear()
+
+    def warm_up(self):
+        """Load the Vosk model in a background thread, once"""
+        if self._model_thread is None:
+            self._model_thread = threading.Thread(target=self._load_model, daemon=True)
+            self._model_thread.start()
+
+    @property
+    def model(self):
+        self.warm_up()
+        self._model_ready.wait()
+        if self._model_error:
+            raise self._model_error
+        return self._model
+
+    def recognizer(self):
+        """Get the reusable streaming recognizer, reset for a new utterance"""
+        with self._recognizer_lock:
+            if self._recognizer is None:
+                self._recognizer = KaldiRecognizer(self.model, SAMPLE_RATE)
+            else:
+                self._recognizer.Reset()
+            return self._recognizer
+
+    @contextmanager
+    def listen(self, since=None):
+        """
+        Receive live microphone frames for the duration of the block; with since, the
+        buffered frames from that frame number on are delivered first
+        """
+        self.start()
+        frames = queue.Queue()
+        with self._listeners_lock:
+            if since is not None:
+                first_buffered = self.frames_read - len(self.ring)
+                for frame in list(self.ring)[max(0, since - first_buffered):]:
+                    frames.put(frame)
+            self._listeners.append(frames)
+        try:
+            yield frames
+        finally:
+            with self._listeners_lock:
+                self._listeners.remove(frames)
+
+    def _load_model(self):
+        try:
+            if not os.path.exists(self.model_path):
+                raise FileNotFoundError(f"Model not found at: {self.model_path}")
+            with startup_profiler.span("vosk Model"):
+                self._model = Model(self.model_path)
+            print("✅ Speech model loaded")
+        except Exception as e:
+            print(f"❌ Error loading speech model: {e}")
+            self._model_error = e
+        finally:
+            self._model_ready.set()
+
+    def _mic_loop(self):
+        """Keep one input stream open, tracking the noise floor between utterances"""
+        import pyaudio
+
+        try:
+            audio = pyaudio.PyAudio()
+            stream = audio.open(format=pyaudio.paInt16, channels=1, rate=SAMPLE_RATE,
+                                input=True, frames_per_buffer=FRAME_SAMPLES)
+        except Exception as e:
+            print(f"❌ Error opening microphone: {e}")
+            self._mic_thread = None
+            return
+
+        try:
+            while self._running.is_set():
+                frame = stream.read(FRAME_SAMPLES, exception_on_overflow=False)
+                with self._listeners_lock:
+                    self.ring.append(frame)
+                    self.frames_read += 1
+                    listeners = list(self._listeners)
+                if not listeners:
+                    self.vad.observe(self.vad.frame_energy(frame))
+                for frames in listeners:
+                    frames.put(frame)
+        except Exception as e:
+            print(f"❌ Microphone error: {e}")
+        finally:
+            stream.stop_stream()
+            stream.close()
+            audio.terminate()
+            self._mic_thread = None
+
+def _recognize_live(recognizer, live_frames, onset_frames, phrase_time_limit=7, on_partial=None, timeout=None):
+    """
+    Decode onset_frames, then keep decoding live frames until the speaker goes quiet.
+    With a timeout, speech must start within it and silence only counts after that
+    """
+    vad = recognizer_service.vad
+    final_text = ""
+    last_partial = ""
+    speaking = timeout is None
+    speech_run = 0
+    silence_run = 0
+    started_at = time.monotonic()
+    frames = list(onset_frames)
+
+    try:
+        while True:
+            for chunk in frames:
+                speech = vad.is_speech(vad.frame_energy(chunk))
+                if speaking:
+                    silence_run = 0 if speech else silence_run + 1
+                else:
+                    speech_run = speech_run + 1 if speech else 0
+                    if speech_run >= vad.start_frames:
+                        speaking = True
+                        started_at = time.monotonic()
+
+                if recognizer.AcceptWaveform(chunk):
+                    final_text += json.loads(recognizer.Result()).get("text", "") + " "
+                elif on_partial:
+                    partial = json.loads(recognizer.PartialResult()).get("partial", "")
+                    if partial and partial != last_partial:
+                        last_partial = partial
+                        on_partial((final_text + partial).strip())
+
+            if not speaking and time.monotonic() - started_at > timeout:
+                print("⏱ Timeout: No speech detected.")
+                break
+            if speaking and (silence_run >= vad.end_silence_frames or time.monotonic() - started_at >= phrase_time_limit):
+                break
+
+            try:
+                frames = [live_frames.get(timeout=1)]
+            except queue.Empty:
+                print("❌ Error: microphone is not delivering audio.")
+                break
+    except Exception as e:
+        print(f"❌ Error: {e}")
+
+    final_text += json.loads(recognizer.FinalResult()).get("text", "")
+    final_text = final_text.strip()
+    if final_text:
+        log_transcript(final_text)
+        print(f"📝 You said: {final_text}")
+    return final_text
+
+def stream_recognize(timeout=4, phrase_time_limit=7, on_partial=None, replay_from=None):
+    """
+    Feed microphone frames straight into Vosk and stop once the speaker goes quiet;
+    replay_from starts from buffered audio, e.g. speech that interrupted an answer
+    """
+    try:
+        recognizer = recognizer_service.recognizer()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return ""
+
+    vad = recognizer_service.vad
+    pre_roll = deque(maxlen=max(1, PRE_ROLL_MS // FRAME_MS))
+    speech_run = 0
+    listen_started = time.monotonic()
+
+    print("🎙 Listening...")
+    with recognizer_service.listen(since=replay_from) as live_frames:
+        while True:
+            try:
+                frame = live_frames.get(timeout=1)
+            except queue.Empty:
+                print("❌ Error: microphone is not delivering audio.")
+                return ""
+            energy = vad.frame_energy(frame)
+            if vad.is_speech(energy):
+                speech_run += 1
+            else:
+                speech_run = 0
+                vad.update_noise_floor(energy)
+            pre_roll.append(frame)
+
+            if speech_run >= vad.start_frames:
+                break
+            if time.monotonic() - listen_started > timeout:
+                print("⏱ Timeout: No speech detected.")
+                return ""
+
+        # Speech confirmed; replay the buffered onset so the first word is not clipped
+        return _recognize_live(recognizer, live_frames, pre_roll, phrase_time_limit, on_partial)
+
+class WakeWordSpotter:
+    """Low-CPU keyword spotting with a grammar-restricted Vosk recognizer"""
+
+    def __init__(self, wake_word=WAKE_WORD, buffer_ms=4000):
+        self.wake_word = wake_word.lower().strip()
+        self.max_buffer_frames = max(1, buffer_ms // FRAME_MS)
+        # Vosk word times count every frame fed since the recognizer was built, across resets
+        self.frames_fed = 0
+        self._recognizer = None
+
+    def recognizer(self):
+        """Build the spotter once; it only knows the wake word and [unk]"""
+        if self._recognizer is None:
+            model = recognizer_service.model
+            self._check_vocabulary(model)
+            grammar = json.dumps([self.wake_word, "[unk]"])
+            self._recognizer = KaldiRecognizer(model, SAMPLE_RATE, grammar)
+            self._recognizer.SetWords(True)
+        else:
+            self._recognizer.Reset()
+        return self._recognizer
+
+    def _check_vocabulary(self, model):
+        """Vosk silently drops grammar words it does not know, which would leave the spotter deaf"""
+        if model.find_word(self.wake_word) >= 0:
+            return
+        if model.find_word(DEFAULT_WAKE_WORD) >= 0:
+            print(f"⚠️ Wake word '{self.wake_word}' is not in the speech model's vocabulary; "
+                  f"using '{DEFAULT_WAKE_WORD}' instead. Set WakeWord in .env to a word the model knows.")
+            self.wake_word = DEFAULT_WAKE_WORD
+        else:
+            raise ValueError(f"Wake word '{self.wake_word}' is not in the speech model's vocabulary")
+
+    def _heard(self, text):
+        return self.wake_word in text.split()
+
+    def _wake_word_end(self, result):
+        """Spotter frame count just after the wake word in a result, or None"""
+        for word in json.loads(result).get("result", []):
+            if word.get("word") == self.wake_word:
+                return int(word.get("end", 0) * 1000) // FRAME_MS
+        return None
+
+    @contextmanager
+    def wait(self, should_stop=lambda: False):
+        """
+        Block until the wake word is heard, then yield the live frame queue and the
+        buffered audio spoken after it; yields (None, []) once should_stop() turns true
+        """
+        vad = recognizer_service.vad
+        pre_roll = deque(maxlen=max(1, PRE_ROLL_MS // FRAME_MS))
+        spotter = self.recognizer()
+        print(f"👂 Waiting for wake word '{self.wake_word}'...")
+        utterance = []
+        utterance_start = 0
+        speech_run = 0
+        silence_run = 0
+
+        with recognizer_service.listen() as live_frames:
+            while not should_stop():
+                try:
+                    frame = live_frames.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                energy = vad.frame_energy(frame)
+                speech = vad.is_speech(energy)
+
+                if not utterance:
+                    # Idle: only track the room; the spotter sees nothing until speech starts
+                    speech_run = speech_run + 1 if speech else 0
+                    if not speech:
+                        vad.update_noise_floor(energy)
+                    pre_roll.append(frame)
+                    if speech_run < vad.start_frames:
+                        continue
+                    utterance = list(pre_roll)
+                    utterance_start = self.frames_fed
+                    pre_roll.clear()
+                    frames = utterance
+                else:
+                    utterance.append(frame)
+                    frames = [frame]
+                    silence_run = 0 if speech else silence_run + 1
+
+                wake_result = None
+                for chunk in frames:
+                    self.frames_fed += 1
+                    if spotter.AcceptWaveform(chunk):
+                        result = spotter.Result()
+                        if self._heard(json.loads(result).get("text", "")):
+                            wake_result = result
+                    elif self._heard(json.loads(spotter.PartialResult()).get("partial", "")):
+                        wake_result = spotter.FinalResult()
+
+                end = self._wake_word_end(wake_result) if wake_result else None
+                if end is not None:
+                    # Hand everything after the wake word to the full recognizer
+                    yield live_frames, utterance[max(0, end - utterance_start):]
+                    return
+
+                if wake_result or silence_run >= vad.end_silence_frames or len(utterance) >= self.max_buffer_frames:
+                    spotter = self.recognizer()
+                    utterance = []
+                    speech_run = 0
+                    silence_run = 0
+        yield None, []
+
+def listen_for_wake_word(should_stop=lambda: False, timeout=4, phrase_time_limit=7, on_wake=None, on_partial=None):
+    """
+    Sleep on the keyword spotter until the wake word is heard, then transcribe the
+    command spoken after it. Returns "" if should_stop() turns true first and None
+    when the speech model is unavailable
+    """
+    try:
+        recognizer = recognizer_service.recognizer()
+    except Exception as e:
+        print(f"❌ Wake word listening unavailable: {e}")
+        return None
+
+    try:
+        with wake_word_spotter.wait(should_stop) as (live_frames, onset_frames):
+            if live_frames is None:
+                return ""
+            print("✨ Wake word detected")
+            if on_wake:
+                on_wake()
+            # People often pause after the wake word; wait for the command to start
+            return _recognize_live(recognizer, live_frames, onset_frames, phrase_time_limit, on_partial, timeout=timeout)
+    except ValueError as e:
+        print(f"❌ Wake word listening unavailable: {e}")
+        return None
+
+class BargeInMonitor:
+    """Watch the microphone while the assistant speaks and call on_speech when the user talks over it"""
+
+    def __init__(self, on_speech, trigger_frames=3, echo_ratio=2.0):
+        self.on_speech = on_speech
+        self.trigger_frames = trigger_frames
+        # The speakers are playing too, so the user has to be clearly louder than normal speech
+        self.echo_ratio = echo_ratio
+        self.triggered = False
+        # Frame number where the interrupting speech began, for replay into the next recognition
+        self.speech_started_at = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=1)
+        return False
+
+    def _run(self):
+        vad = recognizer_service.vad
+        speech_run = 0
+        with recognizer_service.listen() as live_frames:
+            while not self._stop.is_set():
+                try:
+                    frame = live_frames.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                loud = vad.frame_energy(frame) > vad.threshold() * self.echo_ratio
+                speech_run = speech_run + 1 if loud else 0
+                if speech_run >= self.trigger_frames:
+                    self.triggered = True
+                    pre_roll_frames = max(1, PRE_ROLL_MS // FRAME_MS)
+                    self.speech_started_at = recognizer_service.frames_read - live_frames.qsize() - speech_run - pre_roll_frames
+                    self.on_speech()
+                    return
+
+# Global recognizer service; main starts it so the model loads while the GUI comes up
+recognizer_service = RecognizerService()
+
+# Global wake word spotter
+wake_word_spotter = WakeWordSpotter()
+
+def SpeechRecognition(on_partial=None, streaming=True, replay_from=None):
+    if streaming:
+        return stream_recognize(on_partial=on_partial, replay_from=replay_from)
     if listen_and_save():
         return transcribe_audio()
     return ""
@@ -0,0 +1,109 @@
+# Staged Startup for Supriya Assistant
+# Loads subsystems in background threads once the window is up and reports where startup time goes
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from Backend.StartupProfiler import startup_profiler
+
+# Imported first by main, so this is as close to launch as Python code can measure
+LAUNCHED_AT = time.perf_counter()
+
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+class Subsystem:
+    def __init__(self, name: str, loader: Callable[[], None]):
+        self.name = name
+        self.loader = loader
+        self.status = None
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self.done = threading.Event()
+
+    @property
+    def duration_ms(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return (self.finished_at - self.started_at) * 1000
+
+class StartupManager:
+    def __init__(self, on_status: Optional[Callable[[str, str], None]] = None):
+        self.on_status = on_status
+        self.subsystems: Dict[str, Subsystem] = {}
+        self.milestones: List[Tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    def mark(self, label: str) -> float:
+        """Record a milestone and return milliseconds since launch"""
+        elapsed = (time.perf_counter() - LAUNCHED_AT) * 1000
+        with self._lock:
+            self.milestones.append((label, elapsed))
+        print(f"⏱ {label} at {elapsed:.0f} ms")
+        return elapsed
+
+    def add(self, name: str, loader: Callable[[], None]):
+        """Register a subsystem; its loader runs on its own thread when start() is called"""
+        self.subsystems[name] = Subsystem(name, loader)
+
+    def start(self):
+        """Load every registered subsystem in parallel background threads"""
+        for subsystem in self.subsystems.values():
+            if subsystem.started_at is None:
+                subsystem.started_at = time.perf_counter()
+                self._set_status(subsystem, LOADING)
+                threading.Thread(target=self._load, args=(subsystem,), name=f"startup {subsystem.name}", daemon=True).start()
+
+    def wait(self, name: str, timeout: Optional[float] = None) -> bool:
+        """Block until a subsystem has loaded; returns False if it failed or timed out"""
+        subsystem = self.subsystems[name]
+        return subsystem.done.wait(timeout) and subsystem.status == READY
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Block until every subsystem has finished loading; returns False if any failed"""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        ready = True
+        for name in self.subsystems:
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            ready = self.wait(name, remaining) and ready
+        return ready
+
+    def failures(self) -> List[str]:
+        return [s.name for s in self.subsystems.values() if s.status == FAILED]
+
+    def report(self):
+        """Print milestones and per-subsystem load times"""
+        print("⏱ Startup breakdown:")
+        for label, elapsed in self.milestones:
+            print(f"   {label:<28} {elapsed:>8.0f} ms after launch")
+        for subsystem in sorted(self.subsystems.values(), key=lambda s: -s.duration_ms):
+            status = "✅" if subsystem.status == READY else "❌" if subsystem.status == FAILED else "⏳"
+            print(f"   {status} {subsystem.name:<26} {subsystem.duration_ms:>8.0f} ms")
+
+    def _load(self, subsystem: Subsystem):
+        try:
+            with startup_profiler.span(f"load {subsystem.name}"):
+                subsystem.loader()
+            status = READY
+        except BaseException as e:
+            subsystem.error = e
+            status = FAILED
+            print(f"❌ {subsystem.name} failed to load: {e}")
+        subsystem.finished_at = time.perf_counter()
+        self._set_status(subsystem, status)
+        if status == READY:
+            print(f"✅ {subsystem.name} ready in {subsystem.duration_ms:.0f} ms")
+        subsystem.done.set()
+
+    def _set_status(self, subsystem: Subsystem, status: str):
+        subsystem.status = status
+        if self.on_status:
+            try:
+                self.on_status(subsystem.name, status)
+            except Exception as e:
+                print(f"❌ Startup status listener error: {e}")
+
+# Global startup manager instance; main connects on_status to the GUI
+startup = StartupManager()
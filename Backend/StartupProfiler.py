@@ -0,0 +1,211 @@
+# Startup Profiler for Supriya Assistant
+# Records wall time, import time and memory of every module import and profiled span during startup,
+# and writes JSON plus folded-stack flamegraph reports that can be compared between versions
+
+import builtins
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from importlib.util import resolve_name
+
+class StartupProfiler:
+    def __init__(self, output_dir="Data/Profiles"):
+        self.output_dir = output_dir
+        self.enabled = False
+        self.trace_memory = False
+        self.records = []
+        self.started_at = time.perf_counter()
+        self._original_import = None
+        self._process = None
+        self.peak_rss = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def install(self, trace_memory=True):
+        """Start recording; call before the imports that should be measured"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.started_at = time.perf_counter()
+        self.trace_memory = trace_memory
+        # tracemalloc only sees the Python heap; Vosk, Qt, numpy and pygame allocate natively
+        import psutil
+        self._process = psutil.Process()
+        self.peak_rss = self._rss()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def uninstall(self):
+        if not self.enabled:
+            return
+        builtins.__import__ = self._original_import
+        if self.trace_memory:
+            tracemalloc.stop()
+        self.enabled = False
+
+    def span(self, name, kind="span"):
+        """Time a block, e.g. a singleton construction; a no-op unless profiling is enabled"""
+        if not self.enabled:
+            return nullcontext()
+        return self._span(name, kind)
+
+    @contextmanager
+    def _span(self, name, kind):
+        stack = self._stack()
+        frame = {
+            "name": name,
+            "kind": kind,
+            "thread": threading.current_thread().name,
+            "stack": [f["label"] for f in stack],
+            "label": f"import {name}" if kind == "import" else name,
+            "children_ms": 0.0,
+        }
+        memory_before = tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+        rss_before = self._rss()
+        start = time.perf_counter()
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            wall_ms = (time.perf_counter() - start) * 1000
+            rss_after = self._rss()
+            record = {
+                "name": name,
+                "kind": kind,
+                "thread": frame["thread"],
+                "stack": frame["stack"],
+                "start_ms": round((start - self.started_at) * 1000, 3),
+                "wall_ms": round(wall_ms, 3),
+                "self_ms": round(max(0.0, wall_ms - frame["children_ms"]), 3),
+                # Allocations are process-wide, so spans on parallel threads share each other's memory
+                "memory_kb": round((tracemalloc.get_traced_memory()[0] - memory_before) / 1024, 1) if self.trace_memory else None,
+                "rss_kb": round((rss_after - rss_before) / 1024, 1),
+            }
+            if stack:
+                stack[-1]["children_ms"] += wall_ms
+            with self._lock:
+                self.records.append(record)
+                self.peak_rss = max(self.peak_rss, rss_after)
+
+    def _rss(self):
+        return self._process.memory_info().rss if self._process else 0
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """builtins.__import__ replacement that times first-time imports"""
+        original = self._original_import
+        if getattr(self._local, "busy", False):
+            return original(name, globals, locals, fromlist, level)
+        self._local.busy = True
+        try:
+            module_name = name
+            if level:
+                try:
+                    module_name = resolve_name("." * level + name, (globals or {}).get("__package__"))
+                except (ImportError, ValueError):
+                    pass
+            already_loaded = module_name in sys.modules
+        finally:
+            self._local.busy = False
+        if already_loaded:
+            return original(name, globals, locals, fromlist, level)
+        with self._span(module_name, "import"):
+            return original(name, globals, locals, fromlist, level)
+
+    def summary(self):
+        """Total wall time and memory per (kind, name), summed over threads"""
+        totals = {}
+        for record in self.records:
+            key = f"{record['kind']}:{record['name']}"
+            entry = totals.setdefault(key, {"wall_ms": 0.0, "self_ms": 0.0, "memory_kb": 0.0, "rss_kb": 0.0, "count": 0})
+            entry["wall_ms"] = round(entry["wall_ms"] + record["wall_ms"], 3)
+            entry["self_ms"] = round(entry["self_ms"] + record["self_ms"], 3)
+            entry["memory_kb"] = round(entry["memory_kb"] + (record["memory_kb"] or 0), 1)
+            entry["rss_kb"] = round(entry["rss_kb"] + record["rss_kb"], 1)
+            entry["count"] += 1
+        return totals
+
+    def folded(self):
+        """Flamegraph folded stacks, one line per stack with self time in microseconds"""
+        weights = {}
+        for record in self.records:
+            label = f"import {record['name']}" if record["kind"] == "import" else record["name"]
+            path = ";".join([record["thread"]] + record["stack"] + [label])
+            weights[path] = weights.get(path, 0) + int(record["self_ms"] * 1000)
+        return [f"{path} {weight}" for path, weight in weights.items() if weight > 0]
+
+    def save(self, milestones=None):
+        """Write the JSON report and folded flamegraph; returns (json_path, folded_path)"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = os.path.join(self.output_dir, f"startup_{stamp}")
+        with self._lock:
+            records = list(self.records)
+        # Nested imports are already inside their importer's wall time
+        outermost_imports = [r for r in records if r["kind"] == "import" and not any(label.startswith("import ") for label in r["stack"])]
+        report = {
+            "created_at": datetime.datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "elapsed_ms": round((time.perf_counter() - self.started_at) * 1000, 3),
+            "import_ms": round(sum(r["wall_ms"] for r in outermost_imports), 3),
+            "peak_memory_kb": round(tracemalloc.get_traced_memory()[1] / 1024, 1) if self.trace_memory else None,
+            "rss_kb": round(self._rss() / 1024, 1),
+            "peak_rss_kb": round(max(self.peak_rss, self._rss()) / 1024, 1),
+            "milestones": [{"label": label, "ms": round(ms, 3)} for label, ms in (milestones or [])],
+            "summary": self.summary(),
+            "records": records,
+        }
+        with open(f"{base}.json", "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        with open(f"{base}.folded", "w", encoding="utf-8") as file:
+            file.write("\n".join(self.folded()) + "\n")
+        print(f"📊 Startup profile saved: {base}.json (flamegraph: {base}.folded)")
+        return f"{base}.json", f"{base}.folded"
+
+def compare_reports(old_path, new_path, top=25, min_delta_ms=1.0):
+    """Print the largest per-import and per-span wall time changes between two reports"""
+    with open(old_path, encoding="utf-8") as file:
+        old = json.load(file)
+    with open(new_path, encoding="utf-8") as file:
+        new = json.load(file)
+
+    print(f"{'':<48} {'old':>10} {'new':>10} {'delta':>10}")
+    for field in ("elapsed_ms", "import_ms", "peak_memory_kb", "rss_kb", "peak_rss_kb"):
+        print(f"{field:<48} {old.get(field) or 0:>10.1f} {new.get(field) or 0:>10.1f} {(new.get(field) or 0) - (old.get(field) or 0):>+10.1f}")
+
+    rows = []
+    for key in set(old["summary"]) | set(new["summary"]):
+        before = old["summary"].get(key, {}).get("wall_ms", 0.0)
+        after = new["summary"].get(key, {}).get("wall_ms", 0.0)
+        if abs(after - before) >= min_delta_ms:
+            rows.append((key, before, after, after - before))
+    rows.sort(key=lambda row: -abs(row[3]))
+    for key, before, after, delta in rows[:top]:
+        print(f"{key[:48]:<48} {before:>10.1f} {after:>10.1f} {delta:>+10.1f}")
+    return rows
+
+# Global startup profiler instance; main installs it for --profile-startup
+startup_profiler = StartupProfiler()
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Compare two startup profiles written by main.py --profile-startup")
+    parser.add_argument("old", help="Baseline report (.json)")
+    parser.add_argument("new", help="Report to check for regressions (.json)")
+    parser.add_argument("--top", type=int, default=25, help="Number of changes to show")
+    parser.add_argument("--min-delta", type=float, default=1.0, help="Ignore changes smaller than this many ms")
+    args = parser.parse_args()
+    compare_reports(args.old, args.new, top=args.top, min_delta_ms=args.min_delta)
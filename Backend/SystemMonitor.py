@@ -13,6 +13,7 @@ from dataclasses import dataclass, asdict
 import subprocess
 import socket
 import requests
+from Backend.StartupProfiler import startup_profiler
 
 @dataclass
 class SystemInfo:
@@ -625,7 +626,8 @@ class SystemMonitor:
             json.dump(self.alerts, f, indent=4)
 
 # Global system monitor instance
-system_monitor = SystemMonitor()
+with startup_profiler.span("system_monitor"):
+    system_monitor = SystemMonitor()
 
 # Voice command functions for system monitoring
 def get_system_status_voice(command: str):
@@ -10,6 +10,7 @@ from dataclasses import dataclass, asdict
 from typing import List, Dict, Optional
 from enum import Enum
 import uuid
+from Backend.StartupProfiler import startup_profiler
 
 class Priority(Enum):
     LOW = "low"
@@ -412,7 +413,8 @@ class TaskManager:
             json.dump(self.productivity_stats, f, indent=4)
 
 # Global task manager instance
-task_manager = TaskManager()
+with startup_profiler.span("task_manager"):
+    task_manager = TaskManager()
 
 # Voice command functions for task management
 def create_task_voice(command: str):
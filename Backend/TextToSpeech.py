@@ -3,18 +3,25 @@
 # TextToSpeech.py
 
 import os
+import io
+import re
+import queue
 import pygame
 import asyncio
 import edge_tts
 import time
 import datetime
+import threading
+from concurrent.futures import Future, wait
 from dotenv import dotenv_values
+from Backend.LogWriter import log_writer
+from Backend.AudioCache import audio_cache
 
 # Paths
 DATA_DIR = "Data"
-AUDIO_FILE = os.path.join(DATA_DIR, "output_audio.mp3")
-SILENCE_FILE = os.path.join(DATA_DIR, "silence.mp3")
 LOG_FILE = os.path.join("logs", "history.log")
+READY_SOUNDS = 1  # chunks in synthesis behind the one playing and the one queued on the channel
+MAX_CONCURRENT_SYNTHESIS = 2
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs("logs", exist_ok=True)
 
@@ -24,69 +31,346 @@ DEFAULT_VOICE = env_vars.get("AssistantVoice", "en-US-AriaNeural")
 DEFAULT_PITCH = "+0Hz"
 DEFAULT_RATE = "+0%"
 
-# Init mixer
+# Init mixer; speech gets its own reserved channel so it never touches music playback
 pygame.mixer.init()
+pygame.mixer.set_reserved(1)
+speech_channel = pygame.mixer.Channel(0)
 
 # Save logs
 def log(text):
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        timestamp = datetime.datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
-        f.write(f"{timestamp} {text.strip()}\n")
+    timestamp = datetime.datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
+    log_writer.write(LOG_FILE, f"{timestamp} {text.strip()}")
 
-# Audio Generation
+# Audio Generation: stream edge-tts MP3 data straight into memory
 async def generate_audio(text, voice, pitch, rate):
-    if os.path.exists(AUDIO_FILE):
-        os.remove(AUDIO_FILE)
+    buffer = io.BytesIO()
     communicate = edge_tts.Communicate(text, voice, pitch=pitch, rate=rate)
-    await communicate.save(AUDIO_FILE)
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            buffer.write(chunk["data"])
+    return buffer.getvalue()
 
-# Play Audio
-def play_audio(func=lambda: True):
+class CancellationToken:
+    """Cancelled once to stop speaking; playback and synthesis both watch it"""
+
+    def __init__(self):
+        self.reason = None
+        self._event = threading.Event()
+
+    def cancel(self, reason="cancelled"):
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+class TTSWorker:
+    """
+    Long-lived synthesis thread with its own event loop; requests are queued onto the loop.
+    edge-tts still opens one websocket per request, as its protocol needs, but the loop and
+    its resolver stay warm instead of being rebuilt by asyncio.run for every chunk
+    """
+
+    def __init__(self, max_concurrent=MAX_CONCURRENT_SYNTHESIS):
+        self.max_concurrent = max_concurrent
+        self._loop = None
+        self._semaphore = None
+        self._thread = None
+        self._started = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the worker thread and its event loop, once"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._started.wait()
+
+    def stop(self):
+        """Stop the event loop; later submissions start a new one"""
+        with self._lock:
+            if self._thread is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join(timeout=5)
+                self._thread = None
+                self._started.clear()
+
+    def submit(self, text, voice=DEFAULT_VOICE, pitch=DEFAULT_PITCH, rate=DEFAULT_RATE) -> Future:
+        """Queue text for synthesis and return a future resolving to its MP3 bytes"""
+        cached = audio_cache.get(text, voice, pitch, rate)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+
+        self.start()
+        return asyncio.run_coroutine_threadsafe(self._synthesize(text, voice, pitch, rate), self._loop)
+
+    def synthesize(self, text, voice=DEFAULT_VOICE, pitch=DEFAULT_PITCH, rate=DEFAULT_RATE):
+        """Synthesize text and wait for the MP3 bytes"""
+        return self.submit(text, voice, pitch, rate).result()
+
+    async def _synthesize(self, text, voice, pitch, rate):
+        async with self._semaphore:
+            audio = await generate_audio(text, voice, pitch, rate)
+        await asyncio.to_thread(audio_cache.put, text, voice, pitch, rate, audio)
+        return audio
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+# Global TTS worker instance
+tts_worker = TTSWorker()
+
+def load_sound(audio):
+    """Decode MP3 bytes into a mixer Sound without touching the disk"""
+    return pygame.mixer.Sound(file=io.BytesIO(audio))
+
+# Play Audio: queue each chunk behind the one playing so they join without a gap
+def play_sounds(sounds, func=lambda: True):
+    stopped = False
     try:
-        pygame.mixer.music.load(AUDIO_FILE)
-        pygame.mixer.music.play()
-        while pygame.mixer.music.get_busy():
+        for sound in sounds:
+            print(f"[🔊 Speaking chunk...]")
+            if not speech_channel.get_busy():
+                speech_channel.play(sound)
+                continue
+            while speech_channel.get_queue() is not None:
+                if func() is False:
+                    stopped = True
+                    return
+                time.sleep(0.01)
+            speech_channel.queue(sound)
+        while speech_channel.get_busy():
             if func() is False:
-                break
-            pygame.time.Clock().tick(10)
+                stopped = True
+                return
+            time.sleep(0.01)
     except Exception as e:
         print(f"[❌ Playback Error]: {e}")
     finally:
-        try:
-            pygame.mixer.music.stop()
-            time.sleep(0.2)
-            pygame.mixer.music.load(SILENCE_FILE)
-        except:
-            pass
+        if stopped:
+            speech_channel.stop()
 
-# Split long text
-def chunk_text(text, max_len=300):
-    sentences = text.split(".")
-    chunk = ""
-    for s in sentences:
-        s = s.strip()
-        if not s:
+# Speakable segments: cut at sentence ends, and at clauses when a chunk runs long
+SENTENCE_BOUNDARY = re.compile(r"[.!?…]+[\"')\]]*(?=\s)")
+CLAUSE_BOUNDARY = re.compile(r"[,;:—](?=\s)")
+LIST_MARKER = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+")
+MARKDOWN = re.compile(r"[*_#`]+")
+ABBREVIATIONS = {"mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "e.g", "i.e", "a.m", "p.m", "approx", "no"}
+
+def clean_segment(text):
+    """Drop list markers and markdown so they are not read out"""
+    text = LIST_MARKER.sub("", text)
+    text = MARKDOWN.sub("", text)
+    return " ".join(text.split())
+
+def _is_abbreviation(buffer, end):
+    words = buffer[:end].split()
+    if not words or buffer[end] != ".":
+        return False
+    word = words[-1].lower()
+    return word in ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+def _find_cut(buffer, first, min_chars, max_chars):
+    """Index to cut the buffer at, or None to wait for more tokens"""
+    newline = buffer.find("\n")
+    for match in SENTENCE_BOUNDARY.finditer(buffer):
+        if newline != -1 and newline < match.end():
+            break
+        if _is_abbreviation(buffer, match.start()):
             continue
-        if len(chunk) + len(s) < max_len:
-            chunk += s + ". "
-        else:
-            yield chunk.strip()
-            chunk = s + ". "
-    if chunk:
-        yield chunk.strip()
+        if len(buffer[:match.end()].strip()) >= min_chars:
+            return match.end()
+
+    # Lines (list items, headings) are always spoken on their own
+    if newline != -1:
+        return newline + 1
+
+    # Let the first clause go early so speech can start while the answer streams in
+    if first:
+        for match in CLAUSE_BOUNDARY.finditer(buffer):
+            if len(buffer[:match.end()].strip()) >= min_chars:
+                return match.end()
+
+    if len(buffer) > max_chars:
+        window = buffer[:max_chars]
+        clauses = [m.end() for m in CLAUSE_BOUNDARY.finditer(window) if m.end() >= min_chars]
+        if clauses:
+            return clauses[-1]
+        space = window.rfind(" ")
+        return space if space >= min_chars else max_chars
+    return None
+
+def chunk_stream(tokens, min_chars=20, max_chars=300):
+    """
+    Turn an iterator of LLM tokens into speakable segments as soon as each one is complete.
+    Sentences shorter than min_chars are merged with the next; nothing exceeds max_chars
+    """
+    buffer = ""
+    first = True
+
+    def cuts(final=False):
+        nonlocal buffer, first
+        while buffer:
+            cut = _find_cut(buffer, first, min_chars, max_chars)
+            if cut is None:
+                if not final:
+                    return
+                cut = len(buffer)
+            segment = clean_segment(buffer[:cut])
+            buffer = buffer[cut:]
+            if segment:
+                first = False
+                yield segment
+
+    for token in tokens:
+        buffer += token
+        yield from cuts()
+    # The last sentence has no whitespace after it; close it off
+    buffer += "\n"
+    yield from cuts(final=True)
+
+# Split complete text into segments
+def chunk_text(text, max_len=300):
+    return chunk_stream([text], max_chars=max_len)
+
+# Synthesize the next segments on the worker while the current one is playing
+def speak_segments(segments, voice=DEFAULT_VOICE, pitch=DEFAULT_PITCH, rate=DEFAULT_RATE, cancel_token=None):
+    cancel_token = cancel_token or CancellationToken()
+    pending = queue.Queue(maxsize=READY_SOUNDS)
+    done = object()
+
+    def put(item):
+        while not cancel_token.cancelled:
+            try:
+                pending.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def submit_segments():
+        try:
+            for segment in segments:
+                if cancel_token.cancelled:
+                    break
+                future = tts_worker.submit(segment, voice, pitch, rate)
+                if not put(future):
+                    future.cancel()
+                    break
+        except Exception as e:
+            print(f"[❌ Stream Error]: {e}")
+        finally:
+            put(done)
+            if cancel_token.cancelled and hasattr(segments, "close"):
+                # Stop pulling the rest of the answer; nothing more will be spoken
+                segments.close()
+
+    def sounds():
+        while not cancel_token.cancelled:
+            try:
+                future = pending.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if future is done:
+                return
+            while not future.done() and not cancel_token.cancelled:
+                wait([future], timeout=0.05)
+            if cancel_token.cancelled:
+                future.cancel()
+                return
+            try:
+                yield load_sound(future.result())
+            except Exception as e:
+                print(f"[❌ Error]: {e}")
+
+    threading.Thread(target=submit_segments, daemon=True).start()
+    play_sounds(sounds(), func=lambda: not cancel_token.cancelled)
+
+    if cancel_token.cancelled:
+        # Drop synthesis that was queued but will never be played
+        while True:
+            try:
+                future = pending.get_nowait()
+            except queue.Empty:
+                break
+            if future is not done:
+                future.cancel()
+        print(f"[⏹ Stopped Speaking: {cancel_token.reason}]")
 
 # 🎙️ Main Exported TTS Function
-def TextToSpeech(text, voice=DEFAULT_VOICE, pitch=DEFAULT_PITCH, rate=DEFAULT_RATE):
-    chunks = list(chunk_text(text))
-    for chunk in chunks:
+def TextToSpeech(text, voice=DEFAULT_VOICE, pitch=DEFAULT_PITCH, rate=DEFAULT_RATE, cancel_token=None):
+    speak_segments(chunk_text(text), voice, pitch, rate, cancel_token)
+    log(text)
+    print("[✅ Done Speaking]")
+
+# Speak an answer while it is still being generated
+def TextToSpeechStream(tokens, voice=DEFAULT_VOICE, pitch=DEFAULT_PITCH, rate=DEFAULT_RATE, on_complete=None,
+                       cancel_token=None):
+    """
+    Speak a token stream sentence by sentence. on_complete(text) is called once, as soon as the
+    whole answer has arrived, or with the part received so far when speech is cancelled;
+    either way before this returns
+    """
+    cancel_token = cancel_token or CancellationToken()
+    received = []
+    pending = queue.Queue()
+    lock = threading.Lock()
+    shown = [False]
+
+    def complete():
+        with lock:
+            if shown[0]:
+                return
+            shown[0] = True
+            if on_complete:
+                on_complete("".join(received))
+
+    def read():
+        # Drain the model as fast as it answers; playback back-pressure must not hold the text back
         try:
-            print(f"[🔊 Speaking chunk...]")
-            asyncio.run(generate_audio(chunk, voice, pitch, rate))
-            play_audio()
+            for token in tokens:
+                if cancel_token.cancelled:
+                    break
+                with lock:
+                    received.append(token)
+                pending.put(token)
         except Exception as e:
-            print(f"[❌ Error]: {e}")
+            print(f"❌ Error reading answer: {e}")
+        finally:
+            pending.put(None)
+            if hasattr(tokens, "close"):
+                tokens.close()
+            if not cancel_token.cancelled:
+                complete()
+
+    def buffered():
+        while True:
+            token = pending.get()
+            if token is None:
+                return
+            yield token
+
+    threading.Thread(target=read, daemon=True).start()
+    speak_segments(chunk_stream(buffered()), voice, pitch, rate, cancel_token)
+    # Normally the reader has shown the answer long ago; after a barge-in show what arrived
+    complete()
+    with lock:
+        text = "".join(received)
     log(text)
     print("[✅ Done Speaking]")
+    return text
 
 # Optional CLI loop
 def start_tts():
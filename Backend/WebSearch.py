@@ -0,0 +1,117 @@
+# Web Search helpers for Supriya Assistant
+# Caches Google results and fetches the top result pages concurrently for richer grounding
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+import requests
+from bs4 import BeautifulSoup
+from googlesearch import search
+from Backend.Resilience import call_with_retry
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.75 Safari/537.36"
+
+@dataclass
+class SearchResult:
+    title: str
+    description: str
+    url: str
+    content: str = ""
+
+def extract_readable_text(html: str, max_chars: int = 1200) -> str:
+    """Extract the main paragraph text of a page"""
+    soup = BeautifulSoup(html, 'html.parser')
+    for tag in soup(["script", "style", "noscript", "nav", "header", "footer", "aside", "form"]):
+        tag.decompose()
+
+    paragraphs = []
+    used = 0
+    for p in soup.find_all("p"):
+        text = " ".join(p.get_text(" ").split())
+        if len(text) < 40:
+            continue
+        paragraphs.append(text)
+        used += len(text) + 1
+        if used >= max_chars:
+            break
+    return " ".join(paragraphs)[:max_chars]
+
+class WebSearch:
+    def __init__(self, num_results: int = 5, fetch_pages: int = 3, page_timeout: float = 4.0,
+                 cache_ttl: int = 600, max_cache_entries: int = 128, snippet_chars: int = 1200,
+                 max_page_bytes: int = 512 * 1024):
+        self.num_results = num_results
+        self.fetch_pages = fetch_pages
+        self.page_timeout = page_timeout
+        self.max_page_bytes = max_page_bytes
+        self.cache_ttl = cache_ttl
+        self.max_cache_entries = max_cache_entries
+        self.snippet_chars = snippet_chars
+
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        self._cache: Dict[str, Tuple[float, List[SearchResult]]] = {}
+        self._lock = threading.Lock()
+        # A long-lived pool: abandoned slow pages finish in the background instead of being joined
+        self._executor = ThreadPoolExecutor(max_workers=max(1, fetch_pages * 2), thread_name_prefix="web-fetch")
+
+    def search(self, query: str) -> List[SearchResult]:
+        """Search Google and ground the top results with page text, using the cache when fresh"""
+        key = " ".join(query.lower().split())
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and time.time() - cached[0] <= self.cache_ttl:
+                return cached[1]
+
+        raw_results = call_with_retry(
+            "google", lambda: list(search(query, advanced=True, num_results=self.num_results))
+        )
+        results = [SearchResult(r.title, r.description, r.url) for r in raw_results]
+        if self.fetch_pages > 0 and results:
+            self._fetch_contents(results[:self.fetch_pages])
+
+        with self._lock:
+            self._cache[key] = (time.time(), results)
+            if len(self._cache) > self.max_cache_entries:
+                oldest = min(self._cache, key=lambda k: self._cache[k][0])
+                del self._cache[oldest]
+        return results
+
+    def clear_cache(self):
+        """Drop all cached search results"""
+        with self._lock:
+            self._cache.clear()
+
+    def _fetch_contents(self, results: List[SearchResult]):
+        """Fetch result pages concurrently, waiting at most page_timeout for all of them"""
+        deadline = time.monotonic() + self.page_timeout
+        futures = {self._executor.submit(self._fetch_text, result.url, deadline): result for result in results}
+        done, not_done = wait(futures, timeout=self.page_timeout)
+
+        for future in not_done:
+            future.cancel()
+            print(f"⚠️ Skipping slow page {futures[future].url}")
+        for future in done:
+            try:
+                futures[future].content = future.result()
+            except requests.exceptions.RequestException as e:
+                print(f"⚠️ Skipping failing page {futures[future].url}: {e}")
+
+    def _fetch_text(self, url: str, deadline: float) -> str:
+        """Download at most max_page_bytes of an HTML page before the deadline and extract its text"""
+        with self.session.get(url, timeout=self.page_timeout, stream=True) as response:
+            # PDFs and other documents are common in results; skip them before downloading the body
+            if "html" not in response.headers.get("Content-Type", ""):
+                return ""
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=16 * 1024):
+                body += chunk
+                if len(body) >= self.max_page_bytes or time.monotonic() >= deadline:
+                    break
+            encoding = response.encoding or "utf-8"
+        return extract_readable_text(body[:self.max_page_bytes].decode(encoding, errors="replace"), self.snippet_chars)
+
+# Global web search instance
+web_search = WebSearch()
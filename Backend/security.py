@@ -6,13 +6,24 @@ import json
 import os
 import datetime
 import getpass
+import threading
 from cryptography.fernet import Fernet
 from dotenv import dotenv_values
+from Backend.LogWriter import log_writer
+from Backend.StartupProfiler import startup_profiler
 
 env_vars = dotenv_values(".env")
 
+# Backends are loaded on parallel threads and each builds its own SecuritySystem;
+# they must agree on a single master key and admin account
+_init_lock = threading.Lock()
+
 class SecuritySystem:
     def __init__(self):
+        with startup_profiler.span("SecuritySystem()"):
+            self._init()
+
+    def _init(self):
         self.security_dir = "Data/Security"
         self.auth_file = f"{self.security_dir}/auth.json"
         self.log_file = f"{self.security_dir}/security.log"
@@ -24,8 +35,7 @@ class SecuritySystem:
         # Initialize encryption key
         self.cipher_suite = self._init_encryption()
         
-        # Initialize authentication system
-        self._init_auth_system()
+        # The master password is asked for on first authentication, not at startup
         
         # Security levels for different operations
         self.security_levels = {
@@ -40,22 +50,24 @@ class SecuritySystem:
     
     def _init_encryption(self):
         """Initialize encryption system"""
-        if os.path.exists(self.key_file):
-            with open(self.key_file, 'rb') as key_file:
-                key = key_file.read()
-        else:
-            key = Fernet.generate_key()
-            with open(self.key_file, 'wb') as key_file:
-                key_file.write(key)
+        with _init_lock:
+            if os.path.exists(self.key_file):
+                with open(self.key_file, 'rb') as key_file:
+                    key = key_file.read()
+            else:
+                key = Fernet.generate_key()
+                with open(self.key_file, 'wb') as key_file:
+                    key_file.write(key)
         
         return Fernet(key)
     
     def _init_auth_system(self):
         """Initialize authentication system"""
-        if not os.path.exists(self.auth_file):
-            # Create default admin user
-            default_password = getpass.getpass("Set master password for security system: ")
-            self.create_user("admin", default_password, "high")
+        with _init_lock:
+            if not os.path.exists(self.auth_file):
+                # Create default admin user
+                default_password = getpass.getpass("Set master password for security system: ")
+                self.create_user("admin", default_password, "high")
     
     def create_user(self, username, password, security_level="medium"):
         """Create a new user with hashed password"""
@@ -76,6 +88,7 @@ class SecuritySystem:
     
     def authenticate(self, username=None, password=None):
         """Authenticate user"""
+        self._init_auth_system()
         if not username:
             username = input("Username: ")
         if not password:
@@ -112,10 +125,7 @@ class SecuritySystem:
     def log_action(self, action):
         """Log security actions"""
         timestamp = datetime.datetime.now().isoformat()
-        log_entry = f"{timestamp} - {action}\n"
-        
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+        log_writer.write(self.log_file, f"{timestamp} - {action}")
     
     def _load_users(self):
         """Load user data"""
@@ -131,6 +141,7 @@ class SecuritySystem:
     
     def get_security_logs(self, lines=50):
         """Get recent security logs"""
+        log_writer.flush()
         if os.path.exists(self.log_file):
             with open(self.log_file, 'r', encoding='utf-8') as f:
                 logs = f.readlines()
@@ -0,0 +1,99 @@
+# GUI Asset Cache for Supriya Assistant
+# Decodes each graphic once, keeps DPI-aware scaled copies and shares animations between labels of the same size
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QGuiApplication, QIcon, QMovie, QPixmap
+from PyQt5.QtWidgets import QLabel
+from PyQt5 import sip
+
+class AssetCache:
+    def __init__(self):
+        self._sources = {}
+        self._pixmaps = {}
+        self._icons = {}
+        self._movies = {}
+        self._movie_viewers = {}
+
+    def device_pixel_ratio(self):
+        screen = QGuiApplication.primaryScreen()
+        return screen.devicePixelRatio() if screen else 1.0
+
+    def pixmap(self, path, width, height):
+        """Get a pixmap scaled to width x height logical pixels for the screen's DPI"""
+        ratio = self.device_pixel_ratio()
+        key = (path, width, height, ratio)
+        if key not in self._pixmaps:
+            if path not in self._sources:
+                self._sources[path] = QPixmap(path)
+            source = self._sources[path]
+            if source.isNull():
+                print(f"Error: {path} does not exist.")
+                return source
+            scaled = source.scaled(int(width * ratio), int(height * ratio), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            scaled.setDevicePixelRatio(ratio)
+            self._pixmaps[key] = scaled
+        return self._pixmaps[key]
+
+    def icon(self, path):
+        if path not in self._icons:
+            self._icons[path] = QIcon(path)
+        return self._icons[path]
+
+    def movie_key(self, path, size):
+        return (path, size.width(), size.height())
+
+    def movie(self, path, size):
+        """Get the shared movie for path decoded at size"""
+        # Frames are decoded on demand (CacheNone); caching every full-screen frame costs megabytes each
+        key = self.movie_key(path, size)
+        movie = self._movies.get(key)
+        if movie is None:
+            movie = QMovie(path)
+            movie.setScaledSize(size)
+            self._movies[key] = movie
+            self._movie_viewers[key] = 0
+        return movie
+
+    def movie_shown(self, key):
+        """A label showing the movie became visible; run the animation"""
+        self._movie_viewers[key] += 1
+        movie = self._movies[key]
+        if movie.state() == QMovie.NotRunning:
+            movie.start()
+        elif movie.state() == QMovie.Paused:
+            movie.setPaused(False)
+
+    def movie_hidden(self, key):
+        """A label showing the movie was hidden; pause once nobody can see it"""
+        self._movie_viewers[key] = max(0, self._movie_viewers[key] - 1)
+        movie = self._movies[key]
+        if sip.isdeleted(movie):
+            # Labels are hidden once more while the application shuts down
+            return
+        if self._movie_viewers[key] == 0 and movie.state() == QMovie.Running:
+            movie.setPaused(True)
+
+class AnimatedLabel(QLabel):
+    """Shows a shared movie and keeps it running only while the label is on screen"""
+
+    def __init__(self, path, size, parent=None):
+        super().__init__(parent)
+        # Each size gets its own movie decoded at that size, so frames are never rescaled on paint
+        self.movie_key = asset_cache.movie_key(path, size)
+        self._counted = False
+        self.setMovie(asset_cache.movie(path, size))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._counted:
+            self._counted = True
+            asset_cache.movie_shown(self.movie_key)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self._counted:
+            self._counted = False
+            asset_cache.movie_hidden(self.movie_key)
+
+# Global asset cache instance
+asset_cache = AssetCache()
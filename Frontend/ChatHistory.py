@@ -0,0 +1,155 @@
+# Chat History View for Supriya Assistant
+# A model/view chat list that only lays out visible messages and pulls older ones from the chat log on demand
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, QVariant
+from PyQt5.QtGui import QColor, QFontMetrics
+from PyQt5.QtWidgets import QAbstractItemView, QFrame, QListView, QStyledItemDelegate
+from Backend.ChatLogStore import chat_log_store
+
+ROLE_USER = "user"
+ROLE_ASSISTANT = "assistant"
+SpeakerRole = Qt.UserRole + 1
+# Messages logged after this point reach the screen through the message feed, so the chat page
+# can be built lazily without showing this session's messages twice
+SESSION_START = len(chat_log_store)
+
+class ChatHistoryModel(QAbstractListModel):
+    def __init__(self, username, assistantname, page_size=50, parent=None):
+        super().__init__(parent)
+        self.username = username
+        self.assistantname = assistantname
+        self.page_size = page_size
+        # Rows are (speaker, text)
+        self.rows = []
+        # Everything before this index in the chat log is older history not loaded yet
+        self.history_start = SESSION_START
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        row = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return row[1]
+        if role == SpeakerRole:
+            return row[0]
+        return QVariant()
+
+    def append_text(self, text):
+        """Append a screen message, one row per non-empty line"""
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        if not lines:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(lines) - 1)
+        self.rows.extend((self._speaker(line), line) for line in lines)
+        self.endInsertRows()
+
+    # Qt calls canFetchMore/fetchMore when a view reaches its *bottom*; older history
+    # belongs above, so it is loaded explicitly when the view is scrolled to the top
+    def can_load_older(self):
+        return self.history_start > 0
+
+    def load_older(self):
+        """Prepend the previous page of messages from the chat log; returns how many rows were added"""
+        if not self.can_load_older():
+            return 0
+        start = max(0, self.history_start - self.page_size)
+        messages = chat_log_store.slice(start, self.history_start)
+        self.history_start = start
+
+        rows = []
+        for message in messages:
+            name = self.username if message.get("role") == ROLE_USER else self.assistantname
+            rows.append((message.get("role", ROLE_ASSISTANT), f"{name} : {message.get('content', '').strip()}"))
+        if rows:
+            self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+            self.rows[0:0] = rows
+            self.endInsertRows()
+        return len(rows)
+
+    def _speaker(self, line):
+        return ROLE_USER if self.username and line.startswith(f"{self.username} :") else ROLE_ASSISTANT
+
+class ChatMessageDelegate(QStyledItemDelegate):
+    """Paints one message with word wrap; sizes are measured once per text and width"""
+
+    def __init__(self, margin=10, parent=None):
+        super().__init__(parent)
+        self.margin = margin
+        self.colors = {ROLE_USER: QColor("#9ecbff"), ROLE_ASSISTANT: QColor(Qt.white)}
+        # Keyed by text rather than row so prepending older history keeps every entry valid
+        self._sizes = {}
+
+    def clear_cache(self):
+        self._sizes.clear()
+
+    def sizeHint(self, option, index):
+        text = index.data(Qt.DisplayRole)
+        width = max(1, self.parent().viewport().width())
+        key = (text, width, option.font.key())
+        if key not in self._sizes:
+            text_rect = QFontMetrics(option.font).boundingRect(
+                QRect(0, 0, width - 2 * self.margin, 100000), Qt.TextWordWrap, text
+            )
+            self._sizes[key] = QSize(width, text_rect.height() + 2 * self.margin)
+        return self._sizes[key]
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setFont(option.font)
+        painter.setPen(self.colors.get(index.data(SpeakerRole), QColor(Qt.white)))
+        rect = option.rect.adjusted(self.margin, self.margin, -self.margin, 0)
+        painter.drawText(rect, Qt.TextWordWrap | Qt.AlignLeft | Qt.AlignTop, index.data(Qt.DisplayRole))
+        painter.restore()
+
+class ChatHistoryView(QListView):
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(ChatMessageDelegate(parent=self))
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setFrameStyle(QFrame.NoFrame)
+        self.setWordWrap(True)
+        # Lay rows out in batches so a long history never blocks the GUI thread in one go
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(100)
+
+        self._stick_to_bottom = True
+        self._distance_from_bottom = None
+        self._adjusting = False
+        self.verticalScrollBar().valueChanged.connect(self._scrolled)
+        self.verticalScrollBar().rangeChanged.connect(self._range_changed)
+
+    def _scrolled(self, value):
+        if self._adjusting:
+            return
+        scroll_bar = self.verticalScrollBar()
+        self._stick_to_bottom = value >= scroll_bar.maximum()
+        self._distance_from_bottom = None
+        if value == scroll_bar.minimum() and self.model().can_load_older():
+            # Older messages appear above; keep what the user is reading where it is
+            self._distance_from_bottom = scroll_bar.maximum() - value
+            self.model().load_older()
+
+    def _range_changed(self, minimum, maximum):
+        """Follow new messages at the bottom, or hold position while history is prepended"""
+        self._adjusting = True
+        try:
+            if self._stick_to_bottom:
+                self.verticalScrollBar().setValue(maximum)
+            elif self._distance_from_bottom is not None:
+                self.verticalScrollBar().setValue(maximum - self._distance_from_bottom)
+        finally:
+            self._adjusting = False
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Row heights depend on the width, so wrapped text is measured again
+        self.itemDelegate().clear_cache()
+        self.scheduleDelayedItemsLayout()
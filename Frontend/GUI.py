@@ -1,8 +1,12 @@
 # Dont Forgot To give Respect To Me(Arya) If you use It 
 from PyQt5.QtWidgets import QApplication, QMainWindow,QSpacerItem, QTextEdit, QStackedWidget, QWidget, QLineEdit, QGridLayout, QVBoxLayout, QHBoxLayout, QPushButton, QFrame, QLabel, QSizePolicy 
 from PyQt5.QtGui import QIcon, QPainter, QMovie, QColor, QTextCharFormat, QFont, QPixmap, QTextBlockFormat, QBrush
-from PyQt5.QtCore import Qt, QSize, QTimer
+from PyQt5.QtCore import Qt, QSize, QTimer, QObject, pyqtSignal
 from dotenv import dotenv_values
+from Frontend.StateBus import state_bus, message_feed, STATUS_TOPIC, MICROPHONE_TOPIC, SUBSYSTEMS_TOPIC
+from Frontend.ChatHistory import ChatHistoryModel, ChatHistoryView
+from Frontend.Assets import asset_cache, AnimatedLabel
+import threading
 import sys
 import os
 
@@ -56,22 +60,41 @@ if not os.path.exists(TempDirectoryPath):
 def TempDirectoryPath():
     return r"C:\Users\techg\OneDrive\Documents\Desktop\Final Project\Frontend\Files"
 
-def SetMicrophoneStatus(Command):
+def _WriteStateFile(Filename, Value):
     temp_dir_path = TempDirectoryPath()
-    with open(rf'{temp_dir_path}\Mic.data', "w", encoding='utf-8') as file:
-        file.write(Command)
+    with open(rf'{temp_dir_path}\{Filename}', "w", encoding='utf-8') as file:
+        file.write(Value)
+
+def _ReadStateFile(Topic, Filename, Default=""):
+    if not state_bus.has(Topic):
+        try:
+            temp_dir_path = TempDirectoryPath()
+            with open(rf'{temp_dir_path}\{Filename}', "r", encoding='utf-8') as file:
+                state_bus.publish(Topic, file.read())
+        except FileNotFoundError:
+            state_bus.publish(Topic, Default)
+    return state_bus.get(Topic, Default)
+
+def SetMicrophoneStatus(Command):
+    if state_bus.publish(MICROPHONE_TOPIC, Command):
+        _WriteStateFile('Mic.data', Command)
 
 def GetMicrophoneStatus():
-    temp_dir_path = TempDirectoryPath()
-    with open(rf'{temp_dir_path}\Mic.data', "r", encoding='utf-8') as file:
-        Status = file.read()
-    return Status
+    return _ReadStateFile(MICROPHONE_TOPIC, 'Mic.data', "False")
+
+def WaitForMicrophoneStatus(Status, timeout=None):
+    return state_bus.wait_for(MICROPHONE_TOPIC, lambda value: value == Status, timeout=timeout)
+
+def WatchMicrophoneStatus(Callback):
+    # Call Callback(Status) on every mic toggle; returns a function that stops watching
+    state_bus.subscribe(MICROPHONE_TOPIC, Callback)
+    return lambda: state_bus.unsubscribe(MICROPHONE_TOPIC, Callback)
 
 def SetAssistantStatus(Status):
+    if not state_bus.publish(STATUS_TOPIC, Status):
+        return
     try:
-        temp_dir_path = TempDirectoryPath()
-        with open(rf'{temp_dir_path}\Status.data', "w", encoding='utf-8') as file:
-           file.write(Status)
+        _WriteStateFile('Status.data', Status)
     except PermissionError as e:
         print(f"Permission error: {e}")
         
@@ -79,10 +102,16 @@ def SetAssistantStatus(Status):
         print(f"An unexpected error occurred: {e}")            
 
 def GetAssistantStatus():
-    temp_dir_path = TempDirectoryPath()
-    with open(rf'{temp_dir_path}\Status.data', "r", encoding='utf-8') as file:
-        Status = file.read()
-    return Status
+    return _ReadStateFile(STATUS_TOPIC, 'Status.data')
+
+_SubsystemsLock = threading.Lock()
+
+def SetSubsystemStatus(Name, Status):
+    # Status is "loading", "ready" or "failed"; the home screen lists what is still warming up
+    with _SubsystemsLock:
+        Subsystems = dict(state_bus.get(SUBSYSTEMS_TOPIC, {}))
+        Subsystems[Name] = Status
+        state_bus.publish(SUBSYSTEMS_TOPIC, Subsystems)
 
 def MicButtonInitialized():
     SetMicrophoneStatus("False")  
@@ -101,9 +130,25 @@ def TempDirectoryPath(filename=None):
     return base_path
 
 def ShowTextToScreen(Text):
-    temp_dir_path = TempDirectoryPath()
-    with open(rf'{temp_dir_path}\Response.data',"w",encoding='utf-8') as file:
-        file.write(Text)
+    # Every call is a new message, even if it repeats the last one
+    message_feed.append(Text)
+    _WriteStateFile('Response.data', Text)
+
+class StateSignals(QObject):
+    status_changed = pyqtSignal(str)
+    microphone_changed = pyqtSignal(str)
+    message_added = pyqtSignal(int)
+    subsystems_changed = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        # Emitting from the voice thread queues delivery onto the GUI thread
+        state_bus.subscribe(STATUS_TOPIC, self.status_changed.emit)
+        state_bus.subscribe(MICROPHONE_TOPIC, self.microphone_changed.emit)
+        message_feed.subscribe(self.message_added.emit)
+        state_bus.subscribe(SUBSYSTEMS_TOPIC, self.subsystems_changed.emit)
+
+state_signals = StateSignals()
      
 class ChatSection(QWidget):
     def __init__(self):
@@ -114,15 +159,14 @@ class ChatSection(QWidget):
         layout.setContentsMargins(-10, 40, 40, 100)
         layout.setSpacing(-100)
         
-        self.chat_text_edit = QTextEdit()
-        self.chat_text_edit.setReadOnly(True)
+        # Only the visible messages are laid out and painted, however long the history gets
+        self.chat_model = ChatHistoryModel(Username, Assistantname)
+        self.chat_view = ChatHistoryView(self.chat_model)
         font = QFont("Arial", 14)  
-        self.chat_text_edit.setFont(font)
-        self.chat_text_edit.setTextInteractionFlags(Qt.NoTextInteraction)
-        self.chat_text_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.chat_text_edit.setFrameStyle(QFrame.NoFrame)
-        self.chat_text_edit.setFixedHeight(400) 
-        layout.addWidget(self.chat_text_edit)
+        self.chat_view.setFont(font)
+        self.chat_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.chat_view.setMinimumHeight(400) 
+        layout.addWidget(self.chat_view)
         
         self.setStyleSheet("background-color: black;")
         layout.setSizeConstraint(QVBoxLayout.SetDefaultConstraint)
@@ -134,15 +178,11 @@ class ChatSection(QWidget):
         text_color_text = QTextCharFormat()  
         text_color_text.setForeground(brush)
 
-        self.gif_label = QLabel()
-        self.gif_label.setStyleSheet("border: none;")
-        movie = QMovie(GraphicsDirectoryPath('Jarvis.gif'))
         max_gif_size_W = 800
         max_gif_size_H = 480
-        movie.setScaledSize(QSize(max_gif_size_W, max_gif_size_H))
+        self.gif_label = AnimatedLabel(GraphicsDirectoryPath('Jarvis.gif'), QSize(max_gif_size_W, max_gif_size_H))
+        self.gif_label.setStyleSheet("border: none;")
         self.gif_label.setAlignment(Qt.AlignRight | Qt.AlignBottom)
-        self.gif_label.setMovie(movie)
-        movie.start()
         layout.addWidget(self.gif_label)
 
         self.label = QLabel("")
@@ -153,14 +193,17 @@ class ChatSection(QWidget):
         
         font = QFont()
         font.setPointSize(15)
-        self.chat_text_edit.setFont(font)
+        self.chat_view.setFont(font)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.loadMessages)
-        self.timer.timeout.connect(self.SpeechRecogText)
-        self.timer.start(1000)
+        # Recent history from the chat log first, then only new screen messages are appended
+        self.chat_model.load_older()
+        self.last_sequence = 0
+        state_signals.message_added.connect(self.loadMessages)
+        state_signals.status_changed.connect(self.SpeechRecogText)
+        self.loadMessages()
+        self.SpeechRecogText()
 
-        self.chat_text_edit.viewport().installEventFilter(self)
+        self.chat_view.viewport().installEventFilter(self)
 
         self.setStyleSheet("""
             QScrollBar:vertical {
@@ -195,41 +238,21 @@ class ChatSection(QWidget):
             }
         """)
 
-    def loadMessages(self):
+    def loadMessages(self, sequence=None):
         global old_chat_message
-        file_path = TempDirectoryPath('Response.data')
-    
-        try:
-            with open(file_path, "r", encoding='utf-8') as file:
-                messages = file.readlines()  
-            
-                for message in messages:
-                    message = message.strip()  
-                    if message:  
-                        self.addMessage(message=message, color='White')
-                        old_chat_message = message  
-        except FileNotFoundError:
-            print(f"File not found: {file_path}")
-        except Exception as e:
-            print(f"An error occurred: {e}")
-
+        for sequence, text in message_feed.since(self.last_sequence):
+            self.last_sequence = sequence
+            self.chat_model.append_text(text)
+            old_chat_message = text.strip() or old_chat_message
 
-    def SpeechRecogText(self):
-        try:
-            with open(TempDirectoryPath('Status.data'), "r", encoding='utf-8') as file:
-                messages = file.read()
-                self.label.setText(messages)
-        except FileNotFoundError:
-            print("Status.data file not found.")
-            self.label.setText("Status data not available.")
-        except Exception as e:
-            print(f"An error occurred: {e}")
+    def SpeechRecogText(self, status=None):
+        if status is None:
+            status = GetAssistantStatus()
+        self.label.setText(status)
 
 
     def load_icon(self, path, width=60, height=60):
-        pixmap = QPixmap(path)
-        new_pixmap = pixmap.scaled(width, height)
-        self.icon_label.setPixmap(new_pixmap)
+        self.icon_label.setPixmap(asset_cache.pixmap(path, width, height))
 
     def toggle_icon(self, event=None):
         if self.toggled:
@@ -241,25 +264,6 @@ class ChatSection(QWidget):
 
         self.toggled = not self.toggled
 
-    def addMessage(self, message, color):
-        if not hasattr(self, "_message_history"):
-            self._message_history = set()
-    
-        if message in self._message_history:
-            return 
-    
-        self._message_history.add(message)
-        cursor = self.chat_text_edit.textCursor()
-        format = QTextCharFormat()
-        formatm = QTextBlockFormat()
-        formatm.setTopMargin(10)
-        formatm.setLeftMargin(10)
-        format.setForeground(QColor(color))  
-        cursor.setCharFormat(format)
-        cursor.setBlockFormat(formatm)
-        cursor.insertText(message + "\n")
-        self.chat_text_edit.setTextCursor(cursor)
-
             
 class InitialScreen(QWidget):
     def __init__(self, parent = None):
@@ -269,18 +273,12 @@ class InitialScreen(QWidget):
         screen_height = desktop.screenGeometry().height()
         content_layout = QVBoxLayout()
         content_layout.setContentsMargins(0, 0, 0, 0)
-        gif_label = QLabel()
-        movie = QMovie(GraphicsDirectoryPath('Jarvis.gif'))
-        gif_label.setMovie(movie)
         max_gif_size_H = int(screen_width /16*6)
-        movie.setScaledSize(QSize(screen_width, max_gif_size_H))
+        gif_label = AnimatedLabel(GraphicsDirectoryPath('Jarvis.gif'), QSize(screen_width, max_gif_size_H))
         gif_label.setAlignment(Qt.AlignCenter)
-        movie.start()
         gif_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.icon_label = QLabel()
-        pixmap = QPixmap(Miconpath)
-        new_pixmap = pixmap.scaled(60, 60)
-        self.icon_label.setPixmap(new_pixmap)
+        self.icon_label.setPixmap(asset_cache.pixmap(Miconpath, 60, 60))
         self.icon_label.setFixedSize(150, 150)
         self.icon_label.setAlignment(Qt.AlignCenter) 
         self.toggled = True
@@ -288,36 +286,43 @@ class InitialScreen(QWidget):
         self.icon_label.mousePressEvent = self.toggle_icon
         self.label = QLabel("Initial Screen")
         self.label.setStyleSheet("color: white; font-size:16px; margin-bottom:0;")
+        self.loading_label = QLabel()
+        self.loading_label.setStyleSheet("color: gray; font-size:13px; margin-bottom:0;")
+        self.loading_label.hide()
         content_layout.addWidget(gif_label, alignment=Qt.AlignCenter)
         content_layout.addWidget(self.label, alignment=Qt.AlignCenter)
+        content_layout.addWidget(self.loading_label, alignment=Qt.AlignCenter)
         content_layout.addWidget(self.icon_label, alignment=Qt.AlignCenter)
         content_layout.setContentsMargins(0, 0, 0, 150)
         self.setLayout(content_layout)
         self.setFixedHeight(screen_height)
         self.setFixedWidth(screen_width)
         self.setStyleSheet("background-color: black;")
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.SpeechRecogText)
-        self.timer.start(5)
+        state_signals.status_changed.connect(self.SpeechRecogText)
+        state_signals.subsystems_changed.connect(self.ShowSubsystems)
+        self.SpeechRecogText()
+        self.ShowSubsystems()
     
-    def SpeechRecogText(self):
-        try:
-            with open(TempDirectoryPath('Status.data'), "r", encoding='utf-8') as file:
-                messages = file.read()
-                self.label.setText(messages)
-        except FileNotFoundError:
-            print("Status.data file not found.")
-            self.label.setText("Status data not available.")
-        except Exception as e:
-            print(f"An error occurred: {e}")
+    def SpeechRecogText(self, status=None):
+        if status is None:
+            status = GetAssistantStatus()
+        self.label.setText(status)
+
+    def ShowSubsystems(self, subsystems=None):
+        if subsystems is None:
+            subsystems = state_bus.get(SUBSYSTEMS_TOPIC, {})
+        icons = {"loading": "⏳", "ready": "✅", "failed": "❌"}
+        if not subsystems or all(status == "ready" for status in subsystems.values()):
+            self.loading_label.hide()
+            return
+        self.loading_label.setText("   ".join(f"{icons.get(status, '⏳')} {name}" for name, status in subsystems.items()))
+        self.loading_label.show()
                 
     def load_icon(self, path, width=60, height=60):
-        if os.path.exists(path):
-            pixmap = QPixmap(path)
-            new_pixmap = pixmap.scaled(width, height)
-            self.icon_label.setPixmap(new_pixmap)
-        else:
-            print(f"Error: {path} does not exist.")
+        # Decoded and scaled once; toggling the mic only swaps cached pixmaps
+        pixmap = asset_cache.pixmap(path, width, height)
+        if not pixmap.isNull():
+            self.icon_label.setPixmap(pixmap)
 
             
     def toggle_icon(self , event = None):
@@ -370,28 +375,28 @@ class CustomTopBar(QWidget):
         layout = QHBoxLayout(self)
         layout.setAlignment(Qt.AlignRight) 
         home_button = QPushButton()
-        home_icon = QIcon(GraphicsDirectoryPath("Home.png"))  
+        home_icon = asset_cache.icon(GraphicsDirectoryPath("Home.png"))  
         home_button.setIcon(home_icon)
         home_button.setText("  Home")
         home_button.setStyleSheet("height:40px; line-height:40px; background-color:white ; color:black;") 
         message_button = QPushButton()
-        message_icon = QIcon(GraphicsDirectoryPath("Chats.png"))  
+        message_icon = asset_cache.icon(GraphicsDirectoryPath("Chats.png"))  
         message_button.setIcon(message_icon)
         message_button.setText("  Chat")
         message_button.setStyleSheet("height:40px; line-height:40px; background-color:white ; color:black;") 
         minimize_button = QPushButton()
-        minimize_icon = QIcon(GraphicsDirectoryPath("Minimize2.png"))  
+        minimize_icon = asset_cache.icon(GraphicsDirectoryPath("Minimize2.png"))  
         minimize_button.setIcon(minimize_icon)
         minimize_button.setStyleSheet("background-color:white;") 
         minimize_button.clicked.connect(self.minimizeWindow)
         self.maximize_button = QPushButton()
-        self.maximize_icon = QIcon(GraphicsDirectoryPath("Minimize.png"))
-        self.restore_icon = QIcon(GraphicsDirectoryPath("Minimize2.png"))  
+        self.maximize_icon = asset_cache.icon(GraphicsDirectoryPath("Minimize.png"))
+        self.restore_icon = asset_cache.icon(GraphicsDirectoryPath("Minimize2.png"))  
         self.maximize_button.setIcon(self.maximize_icon)
         self.maximize_button.setStyleSheet("background-color:white;") 
         self.maximize_button.clicked.connect(self.minimizeWindow)
         close_button = QPushButton()
-        close_icon = QIcon(GraphicsDirectoryPath("close.png"))  
+        close_icon = asset_cache.icon(GraphicsDirectoryPath("close.png"))  
         close_button.setIcon(close_icon)
         close_button.setStyleSheet("background-color:white;") 
         close_button.clicked.connect(self.closeWindow)
@@ -478,19 +483,35 @@ class MainWindow(QMainWindow):
         screen_height = desktop.screenGeometry().height()
         stacked_widget = QStackedWidget(self)
         initial_screen = InitialScreen()
-        Message_screen = MessageScreen()
         stacked_widget.addWidget(initial_screen)
-        stacked_widget.addWidget(Message_screen)
+        # The chat page is built the first time it is opened, not before first paint
+        stacked_widget.addWidget(QWidget())
+        stacked_widget.currentChanged.connect(self.buildMessageScreen)
+        self.stacked_widget = stacked_widget
+        self.message_screen = None
         self.setGeometry(0, 0, screen_width, screen_height)
         self.setStyleSheet("background-color: black;")
         top_bar = CustomTopBar(self, stacked_widget)
         self.setMenuWidget(top_bar)
         self.setCentralWidget(stacked_widget)
+
+    def buildMessageScreen(self, index):
+        if index != 1 or self.message_screen is not None:
+            return
+        placeholder = self.stacked_widget.widget(1)
+        self.message_screen = MessageScreen(self.stacked_widget)
+        self.stacked_widget.insertWidget(1, self.message_screen)
+        self.stacked_widget.setCurrentIndex(1)
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
         
-def GraphicalUserInterface():
+def GraphicalUserInterface(OnShown=None):
+    # OnShown runs on the GUI thread once the window has been handed to the event loop
     app = QApplication(sys.argv)
     window = MainWindow()
-    window.show()        
+    window.show()
+    if OnShown is not None:
+        QTimer.singleShot(0, OnShown)
     sys.exit(app.exec_())
     
 if __name__ =="__main__":
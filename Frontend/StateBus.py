@@ -0,0 +1,112 @@
+# In-process State Bus for Supriya Assistant
+# Shares assistant status, microphone state and screen text between the voice loop and the GUI
+
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+STATUS_TOPIC = "status"
+MICROPHONE_TOPIC = "microphone"
+SUBSYSTEMS_TOPIC = "subsystems"
+
+class StateBus:
+    def __init__(self):
+        self._values: Dict[str, Any] = {}
+        self._subscribers: Dict[str, List[Callable[[Any], None]]] = {}
+        self._condition = threading.Condition()
+
+    def publish(self, topic: str, value: Any, only_on_change: bool = True) -> bool:
+        """Store a new value for a topic and notify subscribers"""
+        with self._condition:
+            if only_on_change and topic in self._values and self._values[topic] == value:
+                return False
+            self._values[topic] = value
+            subscribers = list(self._subscribers.get(topic, []))
+            self._condition.notify_all()
+
+        for callback in subscribers:
+            try:
+                callback(value)
+            except Exception as e:
+                print(f"❌ State bus subscriber error on '{topic}': {e}")
+        return True
+
+    def get(self, topic: str, default: Any = None) -> Any:
+        """Get the latest value published on a topic"""
+        with self._condition:
+            return self._values.get(topic, default)
+
+    def has(self, topic: str) -> bool:
+        """Check whether anything was published on a topic yet"""
+        with self._condition:
+            return topic in self._values
+
+    def subscribe(self, topic: str, callback: Callable[[Any], None]):
+        """Call callback from the publishing thread on every change of topic"""
+        with self._condition:
+            self._subscribers.setdefault(topic, []).append(callback)
+
+    def unsubscribe(self, topic: str, callback: Callable[[Any], None]):
+        """Remove a previously registered callback"""
+        with self._condition:
+            callbacks = self._subscribers.get(topic, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def wait_for(self, topic: str, predicate: Callable[[Any], bool], timeout: Optional[float] = None) -> bool:
+        """Block until the topic value satisfies predicate, without polling"""
+        with self._condition:
+            return self._condition.wait_for(lambda: predicate(self._values.get(topic)), timeout=timeout)
+
+class MessageFeed:
+    """Sequence-numbered screen messages; readers ask only for what they have not seen yet"""
+
+    def __init__(self, max_messages: int = 500):
+        self._messages = deque(maxlen=max_messages)
+        self._sequence = 0
+        self._subscribers: List[Callable[[int], None]] = []
+        self._lock = threading.Lock()
+
+    def append(self, text: str) -> int:
+        """Add a message and return its sequence number"""
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+            self._messages.append((sequence, text))
+            subscribers = list(self._subscribers)
+
+        for callback in subscribers:
+            try:
+                callback(sequence)
+            except Exception as e:
+                print(f"❌ Message feed subscriber error: {e}")
+        return sequence
+
+    def since(self, sequence: int) -> List[Tuple[int, str]]:
+        """Get messages numbered after sequence; older ones past max_messages are gone"""
+        with self._lock:
+            if sequence >= self._sequence:
+                return []
+            # Walk back from the newest so the cost depends only on how many are new
+            new_messages = []
+            for message in reversed(self._messages):
+                if message[0] <= sequence:
+                    break
+                new_messages.append(message)
+            return new_messages[::-1]
+
+    @property
+    def last_sequence(self) -> int:
+        with self._lock:
+            return self._sequence
+
+    def subscribe(self, callback: Callable[[int], None]):
+        """Call callback with the new sequence number after every append"""
+        with self._lock:
+            self._subscribers.append(callback)
+
+# Global state bus instance
+state_bus = StateBus()
+
+# Global message feed instance
+message_feed = MessageFeed()
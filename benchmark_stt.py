@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Supriya Assistant - Offline Speech-to-Text Benchmark
+Runs the SpeechToText recognition path over a folder of WAV files and reports
+real-time factor, latency percentiles, word error rate and peak memory.
+
+Each <name>.wav may have a <name>.txt reference transcript next to it.
+No microphone is needed; this runs headless.
+
+Usage:
+    python benchmark_stt.py corpus/
+    python benchmark_stt.py corpus/ --chunk-sizes 2000 4000 8000 --models vosk-model-small-en-us-0.15 vosk-model-en-us-0.22
+    python benchmark_stt.py corpus/ --json Data/stt_benchmark.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import wave
+from pathlib import Path
+
+from Backend.SpeechToText import VOSK_MODEL_PATH, transcribe_wav
+
+def peak_memory_mb():
+    """Peak resident memory of this process in MB"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is kilobytes on Linux and bytes on macOS
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+
+def normalize_words(text):
+    return re.sub(r"[^a-z0-9' ]+", " ", text.lower()).split()
+
+def word_edit_distance(reference, hypothesis):
+    """Levenshtein distance between two word lists"""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_word in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hypothesis, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            ))
+        previous = current
+    return previous[-1]
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+def load_corpus(corpus_dir):
+    """Collect (wav path, reference text or None, duration in seconds)"""
+    corpus = []
+    for wav_path in sorted(Path(corpus_dir).glob("*.wav")):
+        reference_path = wav_path.with_suffix(".txt")
+        reference = reference_path.read_text(encoding="utf-8").strip() if reference_path.exists() else None
+        with wave.open(str(wav_path), "rb") as wf:
+            duration = wf.getnframes() / float(wf.getframerate())
+        corpus.append((wav_path, reference, duration))
+    return corpus
+
+def run_configuration(model, model_name, chunk_frames, corpus):
+    latencies = []
+    total_audio = 0.0
+    total_edits = 0
+    total_reference_words = 0
+    files = []
+
+    for wav_path, reference, duration in corpus:
+        started = time.perf_counter()
+        hypothesis = transcribe_wav(str(wav_path), model=model, chunk_frames=chunk_frames)
+        latency = time.perf_counter() - started
+
+        latencies.append(latency)
+        total_audio += duration
+        entry = {"file": wav_path.name, "duration_s": duration, "latency_s": latency, "hypothesis": hypothesis}
+
+        if reference is not None:
+            reference_words = normalize_words(reference)
+            edits = word_edit_distance(reference_words, normalize_words(hypothesis))
+            total_edits += edits
+            total_reference_words += len(reference_words)
+            entry["wer"] = edits / len(reference_words) if reference_words else 0.0
+        files.append(entry)
+
+    return {
+        "model": model_name,
+        "chunk_frames": chunk_frames,
+        "files": len(corpus),
+        "audio_s": total_audio,
+        "rtf": sum(latencies) / total_audio if total_audio else 0.0,
+        "latency_p50_s": percentile(latencies, 50),
+        "latency_p90_s": percentile(latencies, 90),
+        "latency_p99_s": percentile(latencies, 99),
+        "latency_max_s": max(latencies) if latencies else 0.0,
+        "wer": total_edits / total_reference_words if total_reference_words else None,
+        "peak_memory_mb": peak_memory_mb(),
+        "per_file": files,
+    }
+
+def print_report(results):
+    print()
+    print(f"{'Model':<34} {'Chunk':>6} {'RTF':>7} {'p50 s':>7} {'p90 s':>7} {'p99 s':>7} {'WER':>7} {'Peak MB':>8}")
+    print("-" * 92)
+    for r in results:
+        wer = f"{r['wer'] * 100:6.2f}%" if r["wer"] is not None else "    n/a"
+        print(f"{r['model'][-34:]:<34} {r['chunk_frames']:>6} {r['rtf']:>7.3f} {r['latency_p50_s']:>7.3f} "
+              f"{r['latency_p90_s']:>7.3f} {r['latency_p99_s']:>7.3f} {wer:>7} {r['peak_memory_mb']:>8.1f}")
+    print("Peak MB is the process-wide high-water mark after each run, so it only grows across runs.")
+    print()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline speech recognition over a WAV corpus")
+    parser.add_argument("corpus", help="Folder with .wav files and optional .txt reference transcripts")
+    parser.add_argument("--models", nargs="+", default=[VOSK_MODEL_PATH], help="Vosk model folders to compare")
+    parser.add_argument("--chunk-sizes", nargs="+", type=int, default=[4000], help="Frames fed to the recognizer per call")
+    parser.add_argument("--json", help="Write the full report, including per-file results, to this file")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print(f"❌ No .wav files found in {args.corpus}")
+        return 1
+
+    from vosk import Model, SetLogLevel
+    SetLogLevel(-1)
+
+    results = []
+    for model_path in args.models:
+        if not os.path.exists(model_path):
+            print(f"❌ Model not found at: {model_path}")
+            continue
+
+        started = time.perf_counter()
+        model = Model(model_path)
+        load_time = time.perf_counter() - started
+        print(f"✅ Loaded {model_path} in {load_time:.2f}s")
+
+        for chunk_frames in args.chunk_sizes:
+            print(f"🎧 {model_path} / chunk {chunk_frames}: {len(corpus)} files")
+            result = run_configuration(model, model_path, chunk_frames, corpus)
+            result["model_load_s"] = load_time
+            results.append(result)
+
+    if not results:
+        return 1
+
+    print_report(results)
+
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print(f"📄 Report written to {args.json}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,13 @@
-# Dont Forgot To give Respect To Me If you use It 
-from Frontend.GUI import (GraphicalUserInterface, SetAssistantStatus, ShowTextToScreen, TempDirectoryPath, SetMicrophoneStatus, AnswerModifier, QueryModifier, GetAssistantStatus, GetMicrophoneStatus)
-from Backend.Model import FirstLayerDMM
-from Backend.RealtimeSearchEngine import RealtimeSearchEngine
-from Backend.Automation import Automation
-from Backend.SpeechToText import SpeechRecognition
-from Backend.TextToSpeech import TextToSpeech
-from Backend.Chatbot import ChatBot
-from Backend.TaskManager import task_manager
-from Backend.EmailManager import email_manager
-from Backend.FileManager import file_manager
-from Backend.SystemMonitor import system_monitor
-from Backend.MediaController import media_controller
+# Dont Forgot To give Respect To Me If you use It 
+import sys
+from Backend.StartupProfiler import startup_profiler
+# python main.py --profile-startup writes import and construction timings to Data/Profiles
+if "--profile-startup" in sys.argv:
+    startup_profiler.install()
+from Backend.Startup import startup
+from Frontend.GUI import (GraphicalUserInterface, SetAssistantStatus, ShowTextToScreen, TempDirectoryPath, SetMicrophoneStatus, AnswerModifier, QueryModifier, GetAssistantStatus, GetMicrophoneStatus, WaitForMicrophoneStatus, WatchMicrophoneStatus, SetSubsystemStatus)
+from Backend.Resilience import CircuitOpenError
+from Backend.ChatLogStore import chat_log_store
 from dotenv import dotenv_values
 from asyncio import run
 from time import sleep
@@ -19,6 +16,7 @@ import threading
 import json
 import os
 
+startup.mark("GUI imported")
 
 # Use all Api keys and other important key's from .env file for safety reason 
 
@@ -31,15 +29,12 @@ subprocess = []
 Functions = ["open", "close" , "play", "system", "content", "google search" , "youtube search", "task", "email", "file", "monitor", "media", "record", "organize", "search files", "backup", "security", "network", "schedule", "note"]
 
 def ShowfaultChatNoChats():
-    with open(r'Data\ChatLog.json', "r", encoding='utf-8') as file:
-        if len(file.read()) < 5:
-            with open(TempDirectoryPath('Database.data'), 'w', encoding='utf-8') as db_file:
-                db_file.write(DefaultMessage)
+    if len(chat_log_store) == 0:
+        with open(TempDirectoryPath('Database.data'), 'w', encoding='utf-8') as db_file:
+            db_file.write(DefaultMessage)
             
 def ReadChatLogJson():
-    with open(r'Data\ChatLog.json','r', encoding='utf-8') as file:
-        chatlog_data = json.load(file)
-        return chatlog_data
+    return chat_log_store.all()
     
 def ChatLogIntegration():
     json_data = ReadChatLogJson()
@@ -72,19 +67,119 @@ def InitialExecution():
     ChatLogIntegration()
     
 InitialExecution()
+
+# Heavy backends are imported by these loaders on background threads after the window is up;
+# each one binds the module-level names the voice loop uses
+
+def LoadVoiceOutput():
+    global TextToSpeech, TextToSpeechStream, CancellationToken
+    from Backend.TextToSpeech import TextToSpeech, TextToSpeechStream, CancellationToken
+
+def LoadVoiceInput():
+    global SpeechRecognition, recognizer_service, listen_for_wake_word, BargeInMonitor
+    from Backend.SpeechToText import SpeechRecognition, recognizer_service, listen_for_wake_word, BargeInMonitor
+    # Open the microphone and wait for the speech model so "ready" means ready to listen
+    recognizer_service.start()
+    recognizer_service.model
+
+def LoadLanguageModels():
+    global FirstLayerDMM, ChatBot, ChatBotStream, RealtimeSearchEngine, RealtimeSearchEngineStream
+    from Backend.Model import FirstLayerDMM
+    from Backend.Chatbot import ChatBot, ChatBotStream
+    from Backend.RealtimeSearchEngine import RealtimeSearchEngine, RealtimeSearchEngineStream
+
+def LoadAutomation():
+    global Automation
+    from Backend.Automation import Automation
+
+def LoadSuperFeatures():
+    global task_manager, email_manager, file_manager, system_monitor, media_controller
+    from Backend.TaskManager import task_manager
+    from Backend.EmailManager import email_manager
+    from Backend.FileManager import file_manager
+    from Backend.SystemMonitor import system_monitor
+    from Backend.MediaController import media_controller
+    system_monitor.start_monitoring(interval=300)  # Monitor every 5 minutes
+
+startup.on_status = SetSubsystemStatus
+startup.add("Voice output", LoadVoiceOutput)
+startup.add("Voice input", LoadVoiceInput)
+startup.add("Language models", LoadLanguageModels)
+startup.add("Automation", LoadAutomation)
+startup.add("Super features", LoadSuperFeatures)
+
+# The voice loop cannot run without these; the rest may fail on their own and stay marked in the GUI
+REQUIRED_SUBSYSTEMS = ("Voice output", "Voice input", "Language models")
+
+# Set by the GUI thread once the main window has been shown
+WindowShown = threading.Event()
+
+def OnWindowShown():
+    startup.mark("Window shown")
+    WindowShown.set()
+
+def GuardedStream(TokenStream):
+    # A failing provider ends the answer with an apology instead of silence
+    try:
+        yield from TokenStream
+    except CircuitOpenError as e:
+        print(f"Error: {e}")
+        yield " I can't reach my language model right now. Please try again in a moment."
+    except Exception as e:
+        print(f"Error: {e}")
+        yield " Sorry, something went wrong while answering that."
+
+# Frame number where the user talked over the last answer; the next turn listens straight
+# away and replays the microphone audio from there so the first word is not clipped
+BargeInFrom = None
+
+def TakeBargeIn():
+    global BargeInFrom
+    ReplayFrom, BargeInFrom = BargeInFrom, None
+    return ReplayFrom
+
+def StreamAnswer(TokenStream):
+    global BargeInFrom
+    # Speak each sentence as soon as the model has produced it
+    def ShowAnswer(Answer):
+        ShowTextToScreen(f"{Assistantname} : {AnswerModifier(Answer)}")
+        
+    SetAssistantStatus("Answering....")
+    
+    # Stop talking as soon as the user speaks or presses the mic button
+    Token = CancellationToken()
+    StopWatching = WatchMicrophoneStatus(lambda Status: Token.cancel("microphone"))
+    try:
+        with BargeInMonitor(on_speech=lambda: Token.cancel("speech")) as Monitor:
+            Answer = TextToSpeechStream(GuardedStream(TokenStream), on_complete=ShowAnswer, cancel_token=Token)
+    finally:
+        StopWatching()
+        
+    if Token.reason == "speech":
+        BargeInFrom = Monitor.speech_started_at
+    return Answer
+
 # Dont Forgot To give Respect To Me If you use It 
 import subprocess
 import os
 
-def MainExecution():
+def ShowPartialTranscript(Partial):
+    SetAssistantStatus(f"Listening.... {Partial}")
+
+def MainExecution(Query=None, ReplayFrom=None):
     TaskExecution = False
     ImageExecution = False
     ImageGenerationQuery = " "
     
     subprocesses = []
     
-    SetAssistantStatus("Listening....")
-    Query = SpeechRecognition()
+    if Query is None:
+        SetAssistantStatus("Listening....")
+        Query = SpeechRecognition(on_partial=ShowPartialTranscript, replay_from=ReplayFrom)
+    if not Query or not Query.strip():
+        # Nobody spoke, e.g. the speakers' own echo set off a barge-in
+        SetAssistantStatus("Available....")
+        return False
     ShowTextToScreen(f"{Username} : {Query}")
     SetAssistantStatus("Thinking....")
     
@@ -108,7 +203,10 @@ def MainExecution():
     if not TaskExecution:
         for queries in Decision:
             if any(queries.startswith(func) for func in Functions):
-                run(Automation(list(Decision)))
+                if startup.wait("Automation"):
+                    run(Automation(list(Decision)))
+                else:
+                    print("❌ Automation is unavailable; skipping task commands")
                 TaskExecution = True
                 break
             
@@ -132,10 +230,7 @@ def MainExecution():
 
     if G and R or R:
         SetAssistantStatus("Searching.....")
-        Answer = RealtimeSearchEngine(QueryModifier(Mearged_query))
-        ShowTextToScreen(f"{Assistantname} : {Answer}")
-        SetAssistantStatus("Answering....")
-        TextToSpeech(Answer)      
+        StreamAnswer(RealtimeSearchEngineStream(QueryModifier(Mearged_query)))
         return True 
 
     else:
@@ -143,27 +238,18 @@ def MainExecution():
             if "general" in Queries:
                 SetAssistantStatus("Thinking....")
                 QueryFinal = Query.replace("general", "")  
-                Answer = ChatBot(QueryModifier(QueryFinal))
-                ShowTextToScreen(f"{Assistantname} : {Answer}")
-                SetAssistantStatus("Answering....")
-                TextToSpeech(Answer)
+                StreamAnswer(ChatBotStream(QueryModifier(QueryFinal)))
                 return True
             elif "Who Made you" in Queries or "Who is Your Creator" in Query or "Who is your Boss" in Query or "Who is Boss" in Query or "Who Named you" in Query or "Who Gave you mind" in Query:
                 SetAssistantStatus("Thinking....")
                 QueryFinal = "Sir You set me in this Desktop But My Boss always is Arya !" 
-                Answer = ChatBot(QueryModifier(QueryFinal))
-                ShowTextToScreen(f"{Assistantname} : {Answer}")
-                SetAssistantStatus("Answering....")
-                TextToSpeech(Answer)
+                StreamAnswer(ChatBotStream(QueryModifier(QueryFinal)))
                 return True
             
             elif "realtime" in Queries:
                 SetAssistantStatus("Searching....")
                 QueryFinal = Query.replace("realtime", "")
-                Answer = ChatBot(QueryModifier(QueryFinal))
-                ShowTextToScreen(f"{Assistantname} : {Answer}")
-                SetAssistantStatus("Answering....")
-                TextToSpeech(Answer)
+                StreamAnswer(ChatBotStream(QueryModifier(QueryFinal)))
                 return True    
 
             elif "exit" in Queries:
@@ -175,38 +261,59 @@ def MainExecution():
                 SetAssistantStatus("Answering....")
                 os._exit(1)  
                              
-def FirstThread():
-    # Initialize super features
-    print("🚀 Initializing Super Assistant Features...")
-    print("✅ Task Management System Ready")
-    print("✅ Email Management System Ready") 
-    print("✅ File Management System Ready")
-    print("✅ System Monitor Ready")
-    print("✅ Media Controller Ready")
-    print("✅ Security System Ready")
-    
-    # Start system monitoring
-    system_monitor.start_monitoring(interval=300)  # Monitor every 5 minutes
-    
-    TextToSpeech("Hello Sir I am Supriya Arya's Super Assistant with advanced features including task management, email handling, file operations, system monitoring, and media control. How can I help you today?")
-    
+def FinishStartup():
+    startup.wait_all()
+    startup.mark("All subsystems loaded")
+    startup.report()
+    if startup_profiler.enabled:
+        startup_profiler.save(startup.milestones)
+        startup_profiler.uninstall()
+
+def FirstThread():
+    # Paint the window first, then warm every subsystem in parallel behind it
+    WindowShown.wait()
+    print("🚀 Initializing Super Assistant Features...")
+    SetAssistantStatus("Starting....")
+    startup.start()
+    
+    # Greet as soon as speech output works; the rest keeps loading while it plays
+    if startup.wait("Voice output"):
+        TextToSpeech("Hello Sir I am Supriya Arya's Super Assistant with advanced features including task management, email handling, file operations, system monitoring, and media control. How can I help you today?")
+    
+    # Optional subsystems finish in the background and are reported once they are all done
+    threading.Thread(target=FinishStartup, daemon=True).start()
+    Ready = all([startup.wait(Name) for Name in REQUIRED_SUBSYSTEMS])
+    if not Ready:
+        SetAssistantStatus(f"Failed to load: {', '.join(startup.failures())}")
+        return
+    
     while True:
         CurrentStatus = GetMicrophoneStatus()
         
         if CurrentStatus == "True":
-            MainExecution()
+            MainExecution(ReplayFrom=TakeBargeIn())
                 
         else:
             AIStatus = GetAssistantStatus()
-            if "Avialable..." in AIStatus:
-                sleep(0.1)
-            else:
+            if "Available..." not in AIStatus:
                 SetAssistantStatus("Available....")
+            # Sleep on the wake word until it is heard or the mic button is pressed
+            Query = listen_for_wake_word(
+                should_stop=lambda: GetMicrophoneStatus() == "True",
+                on_wake=lambda: SetAssistantStatus("Listening...."),
+                on_partial=ShowPartialTranscript
+            )
+            if Query:
+                MainExecution(Query)
+                while BargeInFrom is not None:
+                    MainExecution(ReplayFrom=TakeBargeIn())
+            elif Query is None:
+                WaitForMicrophoneStatus("True")
                             
 # Dont Forgot To give Respect To Me If you use It 
                 
 def SecondThread():
-    GraphicalUserInterface()
+    GraphicalUserInterface(OnShown=OnWindowShown)
     
 if __name__ == "__main__":
     thread2  = threading.Thread(target=FirstThread , daemon=True)